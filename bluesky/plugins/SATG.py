@@ -13,11 +13,17 @@ Folders (idempotent):
   ./satg_data/scenarios/  <-- .scn outputs
 """
 
-import os, math, csv, re, random
+import os, io, math, csv, re, random, heapq
 from datetime import timedelta
-from typing import Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Iterator, List, Optional, Tuple
 import re
 
+import numpy as np
+import pandas as pd
+
 from bluesky import stack
 from bluesky.stack import command
 from bluesky.tools import geo
@@ -29,46 +35,59 @@ T_TROP = 216.65; H_TROP = 11000.0
 A0 = math.sqrt(GAMMA*R*T0)
 FT2M = 0.3048; MS2KT = 1.943844492
 
-def _isa_tp(h_m: float) -> Tuple[float, float]:
-    if h_m < 0: h_m = 0.0
-    if h_m <= H_TROP:
-        T = T0 - L*h_m
-        p = P0 * (T/T0)**(G0/(R*L))
-    else:
-        T = T_TROP
-        p_trop = P0 * (T_TROP/T0)**(G0/(R*L))
-        p = p_trop * math.exp(-G0*(h_m - H_TROP)/(R*T))
+P_TROP = P0 * (T_TROP/T0)**(G0/(R*L))
+
+def _isa_tp_vec(h_m: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ISA temperature [K] and pressure [Pa] for an array of altitudes [m]."""
+    h_m = np.maximum(np.asarray(h_m, dtype=np.float64), 0.0)
+    trop = h_m <= H_TROP
+    T = np.where(trop, T0 - L*h_m, T_TROP)
+    p = np.where(trop, P0 * np.power(T/T0, G0/(R*L)),
+                 P_TROP * np.exp(-G0*(h_m - H_TROP)/(R*T_TROP)))
     return T, p
 
-def _gs_to_cas_kt(gs_kt: float, flight_level: float) -> float:
-    tas_ms = gs_kt / MS2KT  # wind=0 => TAS≈GS
-    h_m = float(flight_level) * 100.0 * FT2M
-    T, p = _isa_tp(h_m)
-    a = math.sqrt(GAMMA*R*T)
-    M = max(tas_ms / a, 0.0)
-    qc = p * ((1 + 0.2*M*M)**3.5 - 1.0)
-    qcp = max(qc / P0 + 1.0, 1.0)
-    cas_ms = A0 * math.sqrt(5.0 * (qcp**(2.0/7.0) - 1.0))
-    if M < 0.1:
-        rho  = p/(R*T); rho0 = P0/(R*T0)
-        cas_ms = tas_ms * math.sqrt(rho/rho0)
+# ISA lookup table per integer flight level; RL points are quantized to whole FLs
+_ISA_FL_MAX = 600
+_ISA_T, _ISA_P = _isa_tp_vec(np.arange(_ISA_FL_MAX + 1) * 100.0 * FT2M)
+_ISA_A = np.sqrt(GAMMA*R*_ISA_T)
+_ISA_RHO_RATIO = (_ISA_P/_ISA_T) / (P0/T0)
+
+def _isa_at_fl(flight_level: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """ISA T, p, speed of sound and rho/rho0 per FL; table gather for integer FL <= _ISA_FL_MAX."""
+    fl = np.asarray(flight_level)
+    if fl.dtype.kind in 'iu' and (fl.size == 0 or fl.max() <= _ISA_FL_MAX):
+        i = np.maximum(fl, 0)
+        return _ISA_T[i], _ISA_P[i], _ISA_A[i], _ISA_RHO_RATIO[i]
+    T, p = _isa_tp_vec(fl.astype(np.float64) * 100.0 * FT2M)
+    return T, p, np.sqrt(GAMMA*R*T), (p/T) / (P0/T0)
+
+def _gs_to_cas_kt_vec(gs_kt: np.ndarray, flight_level: np.ndarray) -> np.ndarray:
+    """GS [kt] -> CAS [kt] for whole arrays of points at once (wind=0 => TAS≈GS)."""
+    tas_ms = np.asarray(gs_kt, dtype=np.float64) / MS2KT
+    T, p, a, rho_ratio = _isa_at_fl(flight_level)
+    M = np.maximum(tas_ms / a, 0.0)
+    qc = p * (np.power(1 + 0.2*M*M, 3.5) - 1.0)
+    qcp = np.maximum(qc / P0 + 1.0, 1.0)
+    cas_ms = A0 * np.sqrt(5.0 * (np.power(qcp, 2.0/7.0) - 1.0))
+    # Low speed: density-ratio (EAS) approximation
+    cas_ms = np.where(M < 0.1, tas_ms * np.sqrt(rho_ratio), cas_ms)
     return cas_ms * MS2KT
 
 # ---------------- Helpers ---------------- #
-def _to_float(s, default=0.0):
-    try: return float(s)
-    except Exception: return default
-
-def _to_int(s, default=0):
-    try: return int(float(s))
-    except Exception: return default
-
-def _to_td(tval) -> timedelta:
-    s = str(tval).strip()
-    if ":" in s:
-        h, m, sec = s.split(":")
-        return timedelta(hours=int(h), minutes=int(m), seconds=float(sec))
-    return timedelta(seconds=float(s))
+def _td_seconds(col: pd.Series) -> np.ndarray:
+    """Seconds for a column of 'H:M:S[.f]' or plain-seconds strings, parsed column-wise."""
+    s = col.astype(str).str.strip()
+    out = np.empty(len(s), dtype=np.float64)
+    hms = s.str.contains(':', regex=False).to_numpy()
+    if hms.any():
+        parts = s[hms].str.split(':', n=2, expand=True)
+        if parts.shape[1] < 3 or parts[2].isna().any():
+            raise ValueError("Time Over must be H:M:S or seconds")
+        out[hms] = (parts[0].astype(int).to_numpy() * 3600 + parts[1].astype(int).to_numpy() * 60
+                    + parts[2].astype(float).to_numpy())
+    if not hms.all():
+        out[~hms] = s[~hms].astype(float).to_numpy()
+    return out
 
 def _stamp(td: timedelta) -> str:
     total = td.total_seconds()
@@ -76,24 +95,32 @@ def _stamp(td: timedelta) -> str:
     return f"{h}:{m:02d}:{s:05.2f}>"
 
 def _echo_lines(lines: List[str]):
-    for line in lines: stack.stack(f"ECHO {line}")
+    # One multi-line ECHO instead of one stack command per line
+    if lines: stack.stack("ECHO " + "\n".join(lines))
 
 def _echo_ok(msg: str, nxt: Optional[str]=None):
-    for line in str(msg).splitlines(): _echo_lines([f"[SATG] {line}"])
-    if nxt: _echo_lines([f"[NEXT] {nxt}"])
+    lines = [f"[SATG] {line}" for line in str(msg).splitlines()]
+    if nxt: lines.append(f"[NEXT] {nxt}")
+    _echo_lines(lines)
 
 def _echo_err(msg: str):
-    for line in str(msg).splitlines(): _echo_lines([f"[SATG][ERR] {line}"])
+    _echo_lines([f"[SATG][ERR] {line}" for line in str(msg).splitlines()])
 
+@lru_cache(maxsize=1024)
 def _fmt_alt_token(fl: int) -> str:
     return "0" if int(fl) <= 0 else f"FL{int(fl)}"
 
+_SANI_RE = re.compile(r'[^A-Za-z0-9_]')
+
+@lru_cache(maxsize=4096)
 def _sanitize_name(name: str) -> str:
-    s = re.sub(r'[^A-Za-z0-9_]', '_', name)
+    s = _SANI_RE.sub('_', name)
     if not s or not s[0].isalpha(): s = "WPT_" + s
     return s[:32]
 
 # ---------------- Math helpers (bearing/destination) ---------------- #
+R_NM = 3440.065  # Earth radius in nautical miles (spherical fallback)
+
 def _bearing_nm(lat1, lon1, lat2, lon2):
     """Initial great-circle bearing (deg) from (lat1,lon1) to (lat2,lon2)."""
     if hasattr(geo, "qdrdist"):
@@ -109,43 +136,40 @@ def _bearing_nm(lat1, lon1, lat2, lon2):
     brg = (math.degrees(math.atan2(y, x)) + 360.0) % 360.0
     return brg
 
-def _dest_nm(lat, lon, brg_deg, dist_nm):
-    """Destination from (lat,lon) along bearing brg_deg for dist_nm nautical miles."""
+def _dest_nm_fast(sin_lat0: float, cos_lat0: float, lon0: float, brg_deg, dist_nm):
+    """Spherical destinations from one origin whose latitude sine/cosine are precomputed."""
+    delta = np.asarray(dist_nm, dtype=np.float64) / R_NM
+    theta = np.radians(brg_deg)
+    sin_delta = np.sin(delta)
+    cos_delta = np.cos(delta)
+
+    # clip to [-1, 1] to avoid numerical issues
+    sin_phi2 = np.clip(sin_lat0 * cos_delta + cos_lat0 * sin_delta * np.cos(theta), -1.0, 1.0)
+    phi2 = np.arcsin(sin_phi2)
+
+    y = np.sin(theta) * sin_delta * cos_lat0
+    x = cos_delta - sin_lat0 * sin_phi2
+    lam2 = np.radians(lon0) + np.arctan2(y, x)
+
+    lat2 = np.degrees(phi2)
+    lon2 = (np.degrees(lam2) + 540.0) % 360.0 - 180.0  # wrap to [-180, 180)
+    return lat2, lon2
+
+def _dest_nm_vec(lat, lon, brg_deg, dist_nm):
+    """Destinations from (lat,lon) along bearings brg_deg for dist_nm nautical miles.
+    Elementwise over arrays; one call places any number of points."""
     if hasattr(geo, "qdrpos"):
-        lat2, lon2 = geo.qdrpos(lat, lon, brg_deg, dist_nm)  # deg, deg
-        return (lat2, lon2)
-    # Fallback (ASCII-only math)
-    import math
-    R_nm = 3440.065  # Earth radius in nautical miles
-    delta = float(dist_nm) / R_nm
-    theta = math.radians(brg_deg)
-    phi1 = math.radians(lat)
-    lam1 = math.radians(lon)
-
-    sin_phi1 = math.sin(phi1)
-    cos_phi1 = math.cos(phi1)
-    sin_delta = math.sin(delta)
-    cos_delta = math.cos(delta)
-
-    sin_phi2 = sin_phi1 * cos_delta + cos_phi1 * sin_delta * math.cos(theta)
-    # clamp to [-1, 1] to avoid numerical issues
-    sin_phi2 = max(-1.0, min(1.0, sin_phi2))
-    phi2 = math.asin(sin_phi2)
-
-    y = math.sin(theta) * sin_delta * cos_phi1
-    x = cos_delta - sin_phi1 * math.sin(phi2)
-    lam2 = lam1 + math.atan2(y, x)
-
-    lat2 = math.degrees(phi2)
-    lon2 = (math.degrees(lam2) + 540.0) % 360.0 - 180.0  # wrap to [-180, 180)
-    return (lat2, lon2)
+        return geo.qdrpos(lat, lon, brg_deg, dist_nm)  # deg, deg
+    # Fallback (ASCII-only math); origin trig is shared by all points of a scalar origin
+    phi1 = np.radians(lat)
+    return _dest_nm_fast(np.sin(phi1), np.cos(phi1), lon, brg_deg, dist_nm)
 
 # ---------------- State ---------------- #
 class _SATGState:
     def __init__(self):
         # RL data
         self.flights: Dict[str, Dict[str, str]] = {}
-        self.base_points: Dict[str, List[dict]] = {}
+        self.base_points: Dict[str, Dict[str, np.ndarray]] = {}  # acid -> field -> array
         self.loaded_ok: bool = False
         # RL jitter (default OFF; params 0 => no noise)
         self.jitter_on: bool = False
@@ -153,6 +177,8 @@ class _SATGState:
         # Jitter coverage (percentage of flights to jitter) 
         self.jitter_pct: float = 100.0
         self.jitter_subset: Optional[set] = None  # set of ACIDs to jitter (None => compute on the fly)
+        # .scn path -> ((mtime_ns, size), highest SC<number>) as last written/scanned by SATG
+        self.sc_index_cache: Dict[str, Tuple[Tuple[int, int], int]] = {}
 
         self.dt_max: float = 0.0
         self.dlat_max: float = 0.0
@@ -175,6 +201,9 @@ class _SATGState:
             "brg1": (0.0, 359.0),
             "angle":(90.0, 90.0),
         }
+        # Staged RL file list (SATG_RL_LOAD_BASE / _APPEND / _COMMIT)
+        self.load_base: str = ""
+        self.load_pending: List[str] = []
         # Last geometric-conflict aircraft (for quick delete)
         self.gc_last_acids: List[str] = []
 
@@ -186,10 +215,39 @@ def _init_dirs(base_dir: Optional[str]=None):
     data = os.path.join(base, "data"); scns = os.path.join(base, "scenarios")
     if STATE.base_dir == base and os.path.isdir(data) and os.path.isdir(scns):
         STATE.data_dir = data; STATE.scn_dir = scns; return
-    if not os.path.isdir(data): os.makedirs(data, exist_ok=True)
-    if not os.path.isdir(scns): os.makedirs(scns, exist_ok=True)
+    os.makedirs(data, exist_ok=True)
+    os.makedirs(scns, exist_ok=True)
     STATE.base_dir = base; STATE.data_dir = data; STATE.scn_dir = scns
 
+# Accepted GC/RC option values
+_TYPES = frozenset({"headon", "cross", "overtake"})
+_ALTMODES = frozenset({"level", "altcross"})
+_ALT_MIX = ("level", "altcross")  # altmode=mix draws from these
+_OVERWRITES = frozenset({"0", "1"})
+
+def _scn_name(name: str) -> str:
+    """Scenario name with an optional 'name=' prefix removed."""
+    nm = name.strip()
+    key, eq, val = nm.partition("=")
+    return val.strip() if eq and key.lower() == "name" else nm
+
+def _resolve_scn_path(name: str, overwrite) -> Tuple[Optional[str], bool]:
+    """(out_path, append) for a scenario-writing command; out_path is None if overwrite is not 0/1.
+    Overwrite removes any existing file; otherwise an existing file is appended to."""
+    ow = str(int(overwrite)) if isinstance(overwrite, (bool, int)) else str(overwrite).strip()
+    if ow not in _OVERWRITES:
+        return None, False
+    os.makedirs(STATE.scn_dir, exist_ok=True)  # may have been removed mid-session
+    out_path = os.path.join(STATE.scn_dir, f"{_scn_name(name)}.scn")
+    if ow == "1":
+        STATE.sc_index_cache.pop(out_path, None)
+        try:
+            os.remove(out_path)
+        except OSError:
+            pass  # nothing to overwrite
+        return out_path, False
+    return out_path, os.path.isfile(out_path)
+
 _init_dirs()
 
 # ---------------- RL I/O ---------------- #
@@ -198,90 +256,129 @@ _EXPECT_POINTS  = {'ECTRL ID','Sequence Number','Time Over','Flight Level','Lati
                    'Delay Time Over','Dev Latitude','Dev Longitude','Dev Flight Level',
                    'ground_speed','vertical_speed','heading','pitch'}
 
-def _read_csv_auto(path: str) -> Tuple[str, List[dict]]:
-    with open(path, newline='', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        hdrs = set([h.strip() for h in (reader.fieldnames or [])])
-        rows = [{k.strip(): (v.strip() if isinstance(v, str) else v) for k, v in r.items()} for r in reader]
-    if _EXPECT_FLIGHTS.issubset(hdrs): return 'flights', rows
-    if _EXPECT_POINTS.issubset(hdrs):  return 'points', rows
-    if {'Airspace ID','Min Flight Level','Max Flight Level','Sequence Number','Latitude','Longitude'}.issubset(hdrs):
-        return 'FIR', rows
-    return '', rows
-
-def _build_base_points(points_rows: List[dict]) -> Dict[str, List[dict]]:
-    pts: Dict[str, List[dict]] = {}
-    for r in points_rows:
-        acid = r['ECTRL ID']
-        pts.setdefault(acid, []).append({
-            'seq': _to_int(r['Sequence Number']),
-            't':   _to_td(r['Time Over']).total_seconds(),
-            'fl':  max(0, _to_int(r['Flight Level'])),
-            'lat': _to_float(r['Latitude']),
-            'lon': _to_float(r['Longitude']),
-            'gs':  _to_float(r.get('ground_speed', 0.0)),
-            'hdg': _to_float(r.get('heading', float('nan'))),
-        })
-    for acid in pts:
-        pts[acid].sort(key=lambda r: r['seq'])
+_CSV_CHUNKSIZE = 1_000_000  # rows per chunk when streaming large CSVs
+_SCN_BUFSIZE = 1 << 20       # write buffer for scenario files (fewer, larger flushes)
+
+def _strip_frame(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = df.columns.str.strip()
+    for col in df.columns:
+        df[col] = df[col].str.strip()
+    return df
+
+def _csv_header(path: str) -> set:
+    """Stripped column names from the first line of a CSV (empty if unreadable)."""
+    try:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            return {h.strip() for h in next(csv.reader(f), [])}
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return set()
+
+def _read_csv_auto(path: str) -> Tuple[str, Iterator[pd.DataFrame]]:
+    """Classify a CSV by its header line; return (kind, chunk iterator).
+    Only 'flights' and 'points' files are parsed and streamed, other kinds yield no chunks."""
+    hdrs = _csv_header(path)
+    if _EXPECT_FLIGHTS.issubset(hdrs):  kind = 'flights'
+    elif _EXPECT_POINTS.issubset(hdrs): kind = 'points'
+    elif {'Airspace ID','Min Flight Level','Max Flight Level','Sequence Number','Latitude','Longitude'}.issubset(hdrs):
+        return 'FIR', iter(())
+    else:
+        return '', iter(())
+
+    def _chunks():
+        with pd.read_csv(path, encoding='utf-8-sig', dtype=str, keep_default_na=False,
+                         chunksize=_CSV_CHUNKSIZE) as reader:
+            for chunk in reader:
+                yield _strip_frame(chunk)
+    return kind, _chunks()
+
+def _num_col(col: pd.Series, default: float) -> np.ndarray:
+    """Numeric column as float array; unparsable/empty cells become default."""
+    return pd.to_numeric(col, errors='coerce').fillna(default).to_numpy(np.float64)
+
+# Per-point fields of base_points (structure-of-arrays, one array per field per ACID)
+_POINT_DTYPES = {'seq': np.int32, 't': np.float64, 'fl': np.int32,
+                 'lat': np.float64, 'lon': np.float64, 'gs': np.float64, 'hdg': np.float64}
+
+def _append_base_points(acc: Dict[str, Dict[str, List[np.ndarray]]], chunk: pd.DataFrame):
+    """Convert one chunk of flights_points column-wise and add its slices to acc per ACID."""
+    cols = {
+        'seq': np.trunc(_num_col(chunk['Sequence Number'], 0)).astype(np.int32),
+        't':   _td_seconds(chunk['Time Over']),
+        'fl':  np.maximum(np.trunc(_num_col(chunk['Flight Level'], 0)), 0).astype(np.int32),
+        'lat': _num_col(chunk['Latitude'], 0.0),
+        'lon': _num_col(chunk['Longitude'], 0.0),
+        'gs':  _num_col(chunk['ground_speed'], 0.0),
+        'hdg': _num_col(chunk['heading'], float('nan')),
+    }
+    for acid, idx in chunk.groupby('ECTRL ID', sort=False).indices.items():
+        a = acc.get(acid)
+        if a is None:
+            a = acc[acid] = {k: [] for k in _POINT_DTYPES}
+        for k, v in cols.items():
+            a[k].append(v[idx])
+
+def _build_base_points(acc: Dict[str, Dict[str, List[np.ndarray]]]) -> Dict[str, Dict[str, np.ndarray]]:
+    """Join the per-chunk slices of each ACID and order them by sequence number."""
+    pts: Dict[str, Dict[str, np.ndarray]] = {}
+    for acid, a in acc.items():
+        c = {k: np.concatenate(v) if len(v) > 1 else v[0] for k, v in a.items()}
+        order = np.argsort(c['seq'], kind='stable')
+        pts[acid] = {k: v[order] for k, v in c.items()}
     return pts
 
-def _draw_noise(rng: random.Random, delta: float, dist: str, nsig: float) -> float:
-    if delta <= 0: return 0.0
-    if dist == "uniform": return rng.uniform(-delta, +delta)
-    x = rng.gauss(0.0, delta)
+def _draw_noise(rng: np.random.Generator, delta: float, dist: str, nsig: float, n: int) -> np.ndarray:
+    """Draw n noise samples in one call (uniform in ±delta, or normal clamped to ±nsig·delta)."""
+    if delta <= 0: return np.zeros(n)
+    if dist == "uniform": return rng.uniform(-delta, +delta, size=n)
+    x = rng.normal(0.0, delta, size=n)
     lim = nsig * delta
     if lim > 0:
-        if x >  lim: x =  lim
-        if x < -lim: x = -lim
+        np.clip(x, -lim, lim, out=x)
     return x
 
-def _get_points_for_run() -> Dict[str, List[dict]]:
+def _pick_jitter_subset(acids: List[str]) -> set:
+    """Deterministic subset of round(pct% · N) ACIDs, drawn in one call from the jitter seed."""
+    k = int(round((float(STATE.jitter_pct) / 100.0) * len(acids)))
+    if k <= 0: return set()
+    idx = np.random.default_rng(STATE.j_seed).choice(len(acids), size=k, replace=False)
+    return {acids[i] for i in idx.tolist()}
+
+def _get_points_for_run() -> Dict[str, Dict[str, np.ndarray]]:
+    # Callers only read the returned arrays: unjittered flights alias STATE.base_points
     if not STATE.base_points: return {}
-    pts = {acid: [dict(p) for p in plist] for acid, plist in STATE.base_points.items()}
-    if not STATE.jitter_on: return pts
-    rng = random.Random(STATE.j_seed) if STATE.j_seed is not None else random.Random()
+    if not STATE.jitter_on: return STATE.base_points
+    pts = dict(STATE.base_points)
+    rng = np.random.default_rng(STATE.j_seed)
     dist = STATE.jitter_dist.lower(); nsig = STATE.nsig
 
     # If a subset hasn't been computed yet and pct < 100, compute a deterministic one now
-    if STATE.jitter_on and STATE.jitter_subset is None and float(STATE.jitter_pct) < 100.0:
-        acids_all = list(pts.keys())
-        k = int(round((float(STATE.jitter_pct) / 100.0) * len(acids_all)))
-        rng_sel = random.Random(STATE.j_seed) if STATE.j_seed is not None else random.Random()
-        STATE.jitter_subset = set(rng_sel.sample(acids_all, k)) if k > 0 else set()
+    p = float(STATE.jitter_pct)
+    if STATE.jitter_subset is None and p < 100.0:
+        STATE.jitter_subset = _pick_jitter_subset(list(STATE.base_points.keys()))
 
     def _should_jitter(acid: str) -> bool:
-        if not STATE.jitter_on:
-            return False
-        p = float(STATE.jitter_pct)
         if p <= 0.0:
             return False
         if p >= 100.0:
             return True
-        if STATE.jitter_subset is not None:
-            return acid in STATE.jitter_subset
-        # Fallback: deterministic per-ACID decision using seed + hash
-        seed_base = STATE.j_seed if STATE.j_seed is not None else 0
-        # Combine seed and per-run salted hash for stable behavior within this session
-        rng_local = random.Random((seed_base << 32) ^ (hash(acid) & 0xffffffff))
-        return (rng_local.random() * 100.0) < p
-
-    for acid, plist in pts.items():
-        plist.sort(key=lambda r: r['seq'])
+        return acid in STATE.jitter_subset
 
+    for acid, base in STATE.base_points.items():
         # NEW: only jitter this flight if selected
         if not _should_jitter(acid):
             continue
 
-        last_t: Optional[float] = None
-        for p in plist:
-            p['t']  = max(0.0, p['t'] + _draw_noise(rng, STATE.dt_max,   dist, nsig))
-            if last_t is not None:
-                p['t'] = max(p['t'], last_t)
-            p['lat'] += _draw_noise(rng, STATE.dlat_max, dist, nsig)
-            p['lon'] += _draw_noise(rng, STATE.dlon_max, dist, nsig)
-            p['fl']   = max(0, int(round(p['fl'] + _draw_noise(rng, float(STATE.dfl_max), dist, nsig))))
-            last_t = p['t']
+        # Fresh arrays for jittered fields only; seq/gs/hdg stay shared with the base
+        c = dict(base)
+        n = len(c['t'])
+        t = c['t'] + _draw_noise(rng, STATE.dt_max, dist, nsig, n)
+        # Times stay >= 0 and non-decreasing along the route
+        c['t']   = np.maximum.accumulate(np.maximum(t, 0.0))
+        c['lat'] = c['lat'] + _draw_noise(rng, STATE.dlat_max, dist, nsig, n)
+        c['lon'] = c['lon'] + _draw_noise(rng, STATE.dlon_max, dist, nsig, n)
+        fl = c['fl'] + _draw_noise(rng, float(STATE.dfl_max), dist, nsig, n)
+        c['fl']  = np.maximum(np.rint(fl), 0).astype(np.int32)
+        pts[acid] = c
 
     return pts
 
@@ -297,37 +394,86 @@ def _load_files(files_arg: str) -> Tuple[bool, str]:
             paths = [os.path.join(parts[0], fn) for fn in os.listdir(parts[0]) if fn.lower().endswith(".csv")]
         else:
             paths = parts
+    return _load_paths(paths)
+
+def _load_paths(paths: List[str]) -> Tuple[bool, str]:
     if not paths: return False, "No CSV files found."
 
-    flights_rows: List[dict] = []; points_rows: List[dict] = []
+    fl: Dict[str, Dict[str,str]] = {}
+    acc: Dict[str, Dict[str, List[np.ndarray]]] = {}
     found_flights = found_points = False
     for p in paths:
-        kind, rows = _read_csv_auto(p)
-        if kind == 'flights': flights_rows.extend(rows); found_flights = True
-        elif kind == 'points': points_rows.extend(rows); found_points = True
+        kind, chunks = _read_csv_auto(p)
+        try:
+            if kind == 'flights':
+                found_flights = True
+                for chunk in chunks:
+                    for acid, actype, adep, ades in zip(chunk['ECTRL ID'], chunk['AC Type'], chunk['ADEP'], chunk['ADES']):
+                        fl[acid] = {'AC Type': actype, 'ADEP': adep, 'ADES': ades}
+            elif kind == 'points':
+                found_points = True
+                for chunk in chunks:
+                    _append_base_points(acc, chunk)
+        except (pd.errors.ParserError, UnicodeDecodeError) as e:
+            # Unrelated CSVs were skipped by header above; a malformed data file is an error
+            return False, f"Malformed {kind} CSV {os.path.basename(p)}: {e}"
     if not (found_flights and found_points):
         return False, "Missing required files: need both flights and flights_points (by headers)."
 
-    STATE.base_points = _build_base_points(points_rows)
-    fl: Dict[str, Dict[str,str]] = {}
-    for r in flights_rows:
-        acid = r['ECTRL ID']
-        fl[acid] = {'AC Type': r.get('AC Type',''), 'ADEP': r.get('ADEP',''), 'ADES': r.get('ADES','')}
+    STATE.base_points = _build_base_points(acc)
     STATE.flights = fl; STATE.loaded_ok = True
-    return True, f"Loaded {len(fl)} flights, {sum(len(v) for v in STATE.base_points.values())} points."
+    STATE.jitter_subset = None  # drawn from the previous ACIDs; re-picked on next use
+    return True, f"Loaded {len(fl)} flights, {sum(len(c['t']) for c in STATE.base_points.values())} points."
+
+_CRE_ACID_RE = re.compile(r">\s*CRE\s+([A-Za-z0-9_-]+)\s*,")
 
-def _scan_existing_acids(path: str) -> set:
-    """Return a set of ACIDs already present in an .scn (by CRE lines)."""
-    used = set()
+def _scan_scn(path: str) -> Tuple[set, int]:
+    """Single pass over an existing .scn.
+    Returns (set of ACIDs created by CRE lines, highest SC<number> ACID or 0)."""
+    used = set(); maxn = 0
     try:
         with open(path, "r", encoding="utf-8") as f:
-            txt = f.read()
+            for line in f:
+                # Lines like: ...>CRE ACID,TYPE,lat,lon,... (also hand-edited '>  CRE X ,')
+                if "CRE" not in line: continue
+                for m in _CRE_ACID_RE.finditer(line):
+                    acid = m.group(1)
+                    used.add(acid)
+                    if acid.startswith("SC") and acid[2:].isdigit():
+                        n = int(acid[2:])
+                        if n > maxn: maxn = n
     except Exception:
-        return used
-    # Match lines like: ...>CRE ACID,TYPE,lat,lon,...
-    for m in re.finditer(r">\s*CRE\s+([A-Za-z0-9_-]+)\s*,", txt):
-        used.add(m.group(1))
-    return used
+        return set(), 0
+    return used, maxn
+
+def _scn_stat_key(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+def _max_sc_index(path: str) -> int:
+    """Highest SC<number> ACID in path (0 if none); rescans only if the file changed since last noted."""
+    try:
+        key = _scn_stat_key(path)
+    except OSError:
+        return 0
+    hit = STATE.sc_index_cache.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    maxn = _scan_scn(path)[1]
+    STATE.sc_index_cache[path] = (key, maxn)
+    return maxn
+
+def _note_sc_written(path: str, maxn: int, acids=()):
+    """Record the SC maximum after writing acids to path, given maxn as it was before the write."""
+    for acid in acids:
+        if acid.startswith("SC") and acid[2:].isdigit():
+            maxn = max(maxn, int(acid[2:]))
+    try:
+        STATE.sc_index_cache[path] = (_scn_stat_key(path), maxn)
+    except OSError:
+        STATE.sc_index_cache.pop(path, None)
+
+_ACID_NUM_RE = re.compile(r"^(.*?)(\d+)$")
 
 def _next_unique_acid(base: str, used: set) -> str:
     """
@@ -337,139 +483,200 @@ def _next_unique_acid(base: str, used: set) -> str:
     """
     if base not in used:
         return base
-    m = re.match(r"^(.*?)(\d+)$", base)
+    m = _ACID_NUM_RE.match(base)
     if m:
         root, num = m.group(1), m.group(2)
         width = len(num)
+        fmt = lambda k: f"{root}{str(k).zfill(width)}"
         n = int(num)
-        while True:
-            n += 1
-            cand = f"{root}{str(n).zfill(width)}"
-            if cand not in used:
-                return cand
-    # no trailing digits: use _2, _3, ...
-    n = 2
+    else:
+        # no trailing digits: use _2, _3, ...
+        fmt = lambda k: f"{base}_{k}"
+        n = 1
     while True:
-        cand = f"{base}_{n}"
+        n += 1
+        cand = fmt(n)
         if cand not in used:
             return cand
-        n += 1
-
-_TS_RE = re.compile(r"^\s*(\d+):(\d{2}):(\d{2}(?:\.\d+)?)>")
 
 def _parse_ts(line: str):
     """Return total seconds (float) if line starts with H:MM:SS(.ss)>, else None."""
-    m = _TS_RE.match(line)
-    if not m:
+    s = line.lstrip()
+    i = s.find(":")
+    if i <= 0 or s[i+3:i+4] != ":" or not s[:i].isdecimal() or not s[i+1:i+3].isdecimal():
         return None
-    h = int(m.group(1))
-    mnt = int(m.group(2))
-    s = float(m.group(3))
-    return h*3600.0 + mnt*60.0 + s
+    j = s.find(">", i + 4)
+    if j < 0:
+        return None
+    sec = s[i+4:j]
+    if len(sec) < 2 or not sec[:2].isdecimal() or (len(sec) > 2 and not (sec[2] == "." and sec[3:].isdecimal())):
+        return None
+    return int(s[:i])*3600.0 + int(s[i+1:i+3])*60.0 + float(sec)
 
-def _sort_scn_file(path: str):
-    """Stable sort all timestamped lines by time; keep header lines at top in original order."""
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-    except Exception:
-        return  # if we cannot read, do nothing
+def _is_header_line(ln: str) -> bool:
+    # Classic header lines (HOLD/ASAS) stay at the top in original order
+    return ln.strip().startswith("0:") and (">HOLD" in ln or ">ASAS ON" in ln)
 
+def _split_scn_lines(lines: List[str]) -> Tuple[List[str], List[str], np.ndarray]:
+    """Header lines, body lines and body timestamps (NaN for comments / blanks / stray lines)."""
     header = []
-    stamped = []
-    nonstamped = []
-
-    for idx, ln in enumerate(lines):
-        # Keep classic header lines (HOLD/ASAS) as-is at the top
-        if ln.strip().startswith("0:") and (">HOLD" in ln or ">ASAS ON" in ln):
+    body = []
+    for ln in lines:
+        if _is_header_line(ln):
             header.append(ln)
-            continue
-        t = _parse_ts(ln)
-        if t is None:
-            nonstamped.append((idx, ln))  # comments / blanks / stray lines
         else:
-            stamped.append((t, idx, ln))  # stable by (time, original order)
+            body.append(ln)
+    ts = np.fromiter((np.nan if (t := _parse_ts(ln)) is None else t for ln in body),
+                     dtype=np.float64, count=len(body))
+    return header, body, ts
+
+def _merge_sorted_tail(lines: List[str], n_old: int) -> Optional[List[str]]:
+    """Sorted file content when lines[:n_old] is already in sorted layout, else None.
+    Only the appended tail is sorted; it is then merged into the old body."""
+    old, tail = lines[:n_old], lines[n_old:]
+    header, body, ts = _split_scn_lines(old)
+    if old[:len(header)] != header or any(_is_header_line(ln) for ln in tail):
+        return None
+    nostamp = np.isnan(ts)
+    n_st = len(body) - int(nostamp.sum())
+    # Sorted layout: stamped lines first and non-decreasing, stray lines after them
+    if nostamp[:n_st].any() or (n_st > 1 and np.any(np.diff(ts[:n_st]) < 0)):
+        return None
 
-    stamped.sort(key=lambda x: (x[0], x[1]))  # time asc, stable on original index
+    _, tbody, tts = _split_scn_lines(tail)
+    tstamped = np.flatnonzero(~np.isnan(tts))
+    torder = tstamped[np.argsort(tts[tstamped], kind="stable")]
+    # heapq.merge takes from the old body first on ties, as the stable full sort would
+    merged = heapq.merge(zip(ts[:n_st].tolist(), body[:n_st]),
+                         ((tts[i], tbody[i]) for i in torder.tolist()),
+                         key=lambda p: p[0])
+    out = header
+    out.extend([ln for _, ln in merged])
+    out.extend(body[n_st:])
+    out.extend([tbody[i] for i in np.flatnonzero(np.isnan(tts))])
+    return out
+
+def _text_lines(data: bytes) -> List[str]:
+    # Same line splitting / newline translation as reading the file in text mode
+    return io.StringIO(data.decode("utf-8"), newline=None).readlines()
+
+def _sort_scn_file(path: str, tail_from: Optional[int] = None):
+    """Stable sort all timestamped lines by time; keep header lines at top in original order.
+    With tail_from (byte offset of appended data), an already-sorted prefix is merged with the
+    sorted tail instead of re-sorting the whole file."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except Exception:
+        return  # if we cannot read, do nothing
 
-    out = []
-    out.extend(header)
-    out.extend([ln for _, _, ln in stamped])
-    # Keep any non-timestamp lines at the very end in their original relative order
-    out.extend([ln for _, ln in nonstamped])
+    out = None
+    if tail_from:
+        old = _text_lines(data[:tail_from])
+        lines = old + _text_lines(data[tail_from:])
+        out = _merge_sorted_tail(lines, len(old))
+    else:
+        lines = _text_lines(data)
+    if out is None:
+        header, body, ts = _split_scn_lines(lines)
+        nostamp = np.isnan(ts)
+        stamped = np.flatnonzero(~nostamp)
+        order = stamped[np.argsort(ts[stamped], kind="stable")]  # time asc, stable on original index
+
+        out = header
+        out.extend([body[i] for i in order])
+        # Keep any non-timestamp lines at the very end in their original relative order
+        out.extend([body[i] for i in np.flatnonzero(nostamp)])
 
     try:
-        with open(path, "w", encoding="utf-8") as f:
+        with open(path, "w", encoding="utf-8", buffering=_SCN_BUFSIZE) as f:
             f.writelines(out)
     except Exception:
         pass
 
 # ---------------- RL scenario writing ---------------- #
+# ADDWPT line templates (prefix = "<stamp>ADDWPT <acid> ")
+_ADDWPT_POS = "%s%.6f,%.6f,%s,%.1f\n"
+_ADDWPT_NAMED = "%s%s,%s,%.1f\n"
+
 def _write_rl_scn(out_path: str, append: bool = False):
     mode = "a" if append else "w"
-    with open(out_path, mode, encoding="utf-8") as f:
+    # Appended data starts here; only that tail needs sorting
+    tail_from = os.path.getsize(out_path) if append and os.path.exists(out_path) else 0
+    in_order = True; prev_t0 = -math.inf
+    with open(out_path, mode, encoding="utf-8", buffering=_SCN_BUFSIZE) as f:
         if not append:
-            f.write("0:00:00.00>HOLD\n")
-            f.write("0:00:00.00>ASAS ON\n")
+            f.write("0:00:00.00>HOLD\n0:00:00.00>ASAS ON\n")
         points = _get_points_for_run()
 
         # When appending, avoid duplicate callsigns by renaming colliding ACIDs
-        used = _scan_existing_acids(out_path) if append else set()
+        used = _scan_scn(out_path)[0] if append else set()
         name_map = {}  # original_acid -> new_acid
 
-        # Compute a deterministic mapping for this batch
+        # Compute a deterministic mapping for this batch (used also holds the names mapped so far)
         for acid in STATE.flights.keys():
-            new_acid = acid
-            if new_acid in used or new_acid in name_map.values():
-                new_acid = _next_unique_acid(new_acid, used | set(name_map.values()))
+            new_acid = _next_unique_acid(acid, used)
             name_map[acid] = new_acid
             used.add(new_acid)
 
         for acid, meta in STATE.flights.items():
             acid_out = name_map.get(acid, acid)
 
-            if acid not in points or not points[acid]: continue
-            segs = points[acid]; r0 = segs[0]; last = segs[-1]
-            t0 = timedelta(seconds=r0['t']); stamp0 = _stamp(t0)
-            fl0, lat0, lon0 = r0['fl'], r0['lat'], r0['lon']
-            cas0 = _gs_to_cas_kt(r0['gs'], fl0)
-            hdg0 = int(r0['hdg']) if not math.isnan(r0['hdg']) else 0
+            segs = points.get(acid)
+            if segs is None or not len(segs['t']): continue
+            n = len(segs['t'])
+            lat, lon, fl = segs['lat'].tolist(), segs['lon'].tolist(), segs['fl'].tolist()
+            cas = _gs_to_cas_kt_vec(segs['gs'], segs['fl']).tolist()
+            t0 = timedelta(seconds=float(segs['t'][0])); stamp0 = _stamp(t0)
+            if t0.total_seconds() < prev_t0: in_order = False
+            prev_t0 = t0.total_seconds()
+            fl0, lat0, lon0 = fl[0], lat[0], lon[0]
+            cas0 = cas[0]
+            hdg0 = float(segs['hdg'][0])
+            hdg0 = int(hdg0) if not math.isnan(hdg0) else 0
             actype = meta.get('AC Type',''); alt_ft0 = int(fl0) * 100
+            # Collect this aircraft's lines and write them with a single call
+            out: List[str] = []
 
-            f.write(f"{stamp0}CRE {acid_out},{actype},{lat0:.6f},{lon0:.6f},{hdg0:03d},{alt_ft0},{cas0:.1f}\n")
+            out.append(f"{stamp0}CRE {acid_out},{actype},{lat0:.6f},{lon0:.6f},{hdg0:03d},{alt_ft0},{cas0:.1f}\n")
 
-            last_is_landing = int(last['fl']) == 0
+            last_is_landing = int(fl[-1]) == 0
             trigger_on_last = last_is_landing or STATE.autodel
 
             pen_wptname = None; last_wptname = None
             if trigger_on_last:
                 last_wptname = _sanitize_name(f"{acid_out}_DEST")
-                f.write(f"{stamp0}DEFWPT {last_wptname},{last['lat']:.6f},{last['lon']:.6f},FIX\n")
-            if last_is_landing and len(segs) >= 2:
-                pen = segs[-2]
+                out.append(f"{stamp0}DEFWPT {last_wptname},{lat[-1]:.6f},{lon[-1]:.6f},FIX\n")
+            if last_is_landing and n >= 2:
                 pen_wptname = _sanitize_name(f"{acid_out}_APP")
-                f.write(f"{stamp0}DEFWPT {pen_wptname},{pen['lat']:.6f},{pen['lon']:.6f},FIX\n")
-
-            for idx, r in enumerate(segs[1:], start=2):
-                cas_i = _gs_to_cas_kt(r['gs'], r['fl'])
-                is_pen = (idx == len(segs)-1); is_last = (r is last)
-                if is_last and trigger_on_last and last_wptname:
-                    alt_tok = "0" if int(r['fl']) <= 0 else _fmt_alt_token(r['fl'])
-                    f.write(f"{stamp0}ADDWPT {acid_out} {last_wptname},{alt_tok},{cas_i:.1f}\n")
-                elif is_pen and last_is_landing and pen_wptname:
-                    f.write(f"{stamp0}ADDWPT {acid_out} {pen_wptname},{_fmt_alt_token(r['fl'])},{cas_i:.1f}\n")
-                else:
-                    f.write(f"{stamp0}ADDWPT {acid_out} {r['lat']:.6f},{r['lon']:.6f},{_fmt_alt_token(r['fl'])},{cas_i:.1f}\n")
-
-            f.write(f"{stamp0}LNAV {acid_out} ON\n")
-            f.write(f"{stamp0}VNAV {acid_out} ON\n")
+                out.append(f"{stamp0}DEFWPT {pen_wptname},{lat[-2]:.6f},{lon[-2]:.6f},FIX\n")
+
+            # Same stamp/ACID on every ADDWPT line: format all rows 1..n-1 in one map over the
+            # template, then swap in the named DEST/APP rows
+            addwpt_prefix = f"{stamp0}ADDWPT {acid_out} "
+            alt_tok = list(map(_fmt_alt_token, fl))
+            rows = list(map(_ADDWPT_POS.__mod__,
+                            zip(repeat(addwpt_prefix, n-1), lat[1:], lon[1:], alt_tok[1:], cas[1:])))
+            if n >= 2 and trigger_on_last and last_wptname:
+                rows[-1] = _ADDWPT_NAMED % (addwpt_prefix, last_wptname, alt_tok[-1], cas[-1])
+            if n >= 3 and last_is_landing and pen_wptname:
+                rows[-2] = _ADDWPT_NAMED % (addwpt_prefix, pen_wptname, alt_tok[-2], cas[-2])
+            out.extend(rows)
+
+            out.append(f"{stamp0}LNAV {acid_out} ON\n{stamp0}VNAV {acid_out} ON\n")
             if last_is_landing and pen_wptname:
-                f.write(f"{stamp0}{acid_out} AT {pen_wptname} DO {acid_out} ALT 0\n")
+                out.append(f"{stamp0}{acid_out} AT {pen_wptname} DO {acid_out} ALT 0\n")
             if trigger_on_last and last_wptname:
-                f.write(f"{stamp0}{acid_out} AT {last_wptname} DO DEL {acid_out}\n")
-    _sort_scn_file(out_path)
+                out.append(f"{stamp0}{acid_out} AT {last_wptname} DO DEL {acid_out}\n")
+            f.write("".join(out))
+    # Each aircraft's lines share one stamp, so a fresh file written in t0 order is already sorted
+    if append or not in_order:
+        _sort_scn_file(out_path, tail_from)
 
 # ---------------- GC utilities ---------------- #
+_RANGE_RE = re.compile(r"\s*([-+0-9.eE]+)\s*:\s*([-+0-9.eE]+)\s*")
+
+@lru_cache(maxsize=256)
 def _parse_range(text: Optional[str], cur: Tuple[float, float]) -> Tuple[float, float]:
     if not text: return cur
     s = str(text).strip()
@@ -477,9 +684,10 @@ def _parse_range(text: Optional[str], cur: Tuple[float, float]) -> Tuple[float,
         try:
             v = float(s); return (v, v)
         except: return cur
-    a, b = s.split(":", 1)
+    m = _RANGE_RE.fullmatch(s)
+    if m is None: return cur
     try:
-        lo = float(a); hi = float(b)
+        lo = float(m.group(1)); hi = float(m.group(2))
         if lo > hi: lo, hi = hi, lo
         return (lo, hi)
     except:
@@ -497,31 +705,12 @@ def _gc_sample(seed: Optional[int]):
     angle= _rand_in(rng, *r["angle"])
     return rng, cas1, cas2, fl1, fl2, brg1, angle
 
-def _scan_max_sc_index(path: str) -> int:
-    """Return the highest SC<number> found in an existing .scn (0 if none)."""
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            txt = f.read()
-    except Exception:
-        return 0
-    maxn = 0
-    # Look for CRE lines: "...>CRE ACID,TYPE,..."
-    for m in re.finditer(r">\s*CRE\s+([A-Za-z0-9_-]+)\s*,", txt):
-        acid = m.group(1)
-        m2 = re.fullmatch(r"SC(\d+)", acid)
-        if m2:
-            n = int(m2.group(1))
-            if n > maxn: maxn = n
-    return maxn
-
 # ---------------- GC scenario writer (append-aware) ---------------- #
-def _write_gc_scn(out_path: str, *,
-                  append: bool,
-                  name: str, cpa_lat: float, cpa_lon: float, tcpa: float,
-                  typ: str, altmode: str, fl_cpa: Optional[int],
-                  acid1: str, acid2: str, ac1: str, ac2: str,
-                  seed: Optional[int], angle_in: Optional[float]):
-    
+def _gc_conflict(*, cpa_lat: float, cpa_lon: float, tcpa: float,
+                 typ: str, altmode: str, fl_cpa: Optional[int],
+                 acid1: str, acid2: str, ac1: str, ac2: str,
+                 seed: Optional[int], angle_in: Optional[float]) -> Tuple[str, str]:
+    """One 2-aircraft conflict as (scenario lines block, summary text)."""
     # Sample speeds/levels/initial bearing and default crossing angle
     rng, cas1, cas2, fl1, fl2, brg1, angle = _gc_sample(seed)
 
@@ -549,8 +738,8 @@ def _write_gc_scn(out_path: str, *,
     d2_nm = (cas2 / 3600.0) * float(tcpa)
 
     # Start positions: back-project from CPA along opposite course
-    lat1, lon1 = _dest_nm(cpa_lat, cpa_lon, (brg1 + 180.0), d1_nm)
-    lat2, lon2 = _dest_nm(cpa_lat, cpa_lon, (brg2 + 180.0), d2_nm)
+    lats, lons = _dest_nm_vec(cpa_lat, cpa_lon, np.array([brg1, brg2]) + 180.0, np.array([d1_nm, d2_nm]))
+    (lat1, lat2), (lon1, lon2) = lats.tolist(), lons.tolist()
 
     # Altitudes
     if altmode.lower() == "level":
@@ -574,41 +763,50 @@ def _write_gc_scn(out_path: str, *,
     tzero = timedelta(seconds=0.0)
     stamp0 = _stamp(tzero)
 
-    # Write / append
-    mode = "a" if append else "w"
-    with open(out_path, mode, encoding="utf-8") as f:
-        if not append:
-            f.write("0:00:00.00>HOLD\n")
-            f.write("0:00:00.00>ASAS ON\n")
-
+    block = "".join([
         # AC1
-        f.write(f"{stamp0}CRE {acid1},{ac1},{lat1:.6f},{lon1:.6f},{hdg1:03d},{fl1_start*100},{cas1:.1f}\n")
-        f.write(f"{stamp0}ADDWPT {acid1} {cpa_lat:.6f},{cpa_lon:.6f},{_fmt_alt_token(fl_cpa1)},{cas1:.1f}\n")
-        f.write(f"{stamp0}LNAV {acid1} ON\n{stamp0}VNAV {acid1} ON\n")
-
+        f"{stamp0}CRE {acid1},{ac1},{lat1:.6f},{lon1:.6f},{hdg1:03d},{fl1_start*100},{cas1:.1f}\n",
+        f"{stamp0}ADDWPT {acid1} {cpa_lat:.6f},{cpa_lon:.6f},{_fmt_alt_token(fl_cpa1)},{cas1:.1f}\n",
+        f"{stamp0}LNAV {acid1} ON\n{stamp0}VNAV {acid1} ON\n",
         # AC2
-        f.write(f"{stamp0}CRE {acid2},{ac2},{lat2:.6f},{lon2:.6f},{hdg2:03d},{fl2_start*100},{cas2:.1f}\n")
-        f.write(f"{stamp0}ADDWPT {acid2} {cpa_lat:.6f},{cpa_lon:.6f},{_fmt_alt_token(fl_cpa2)},{cas2:.1f}\n")
-        f.write(f"{stamp0}LNAV {acid2} ON\n{stamp0}VNAV {acid2} ON\n")
+        f"{stamp0}CRE {acid2},{ac2},{lat2:.6f},{lon2:.6f},{hdg2:03d},{fl2_start*100},{cas2:.1f}\n",
+        f"{stamp0}ADDWPT {acid2} {cpa_lat:.6f},{cpa_lon:.6f},{_fmt_alt_token(fl_cpa2)},{cas2:.1f}\n",
+        f"{stamp0}LNAV {acid2} ON\n{stamp0}VNAV {acid2} ON\n",
+    ])
 
     # Track all aircraft created in this session (for GC_DEL)
     STATE.gc_last_acids.extend([acid1, acid2])
 
-    # Echo summary (ASCII only)
+    # Summary (ASCII only)
     r = STATE.gc_ranges
     ang_txt = f"{angle:.1f} deg" if typ == "cross" else "-"
-    act = "appended to" if append else "written"
-    _echo_ok(
-        (f"GC {act}: {out_path}\n"
-         f" type={typ} altmode={altmode} CPA=({cpa_lat:.4f},{cpa_lon:.4f}) tcpa={tcpa}s angle={ang_txt}\n"
+    return block, (f" type={typ} altmode={altmode} CPA=({cpa_lat:.4f},{cpa_lon:.4f}) tcpa={tcpa}s angle={ang_txt}\n"
          f" Minima: HSEP={STATE.gc_hsep_nm} NM, VSEP={STATE.gc_vsep_ft} ft\n"
          f" Ranges: cas1={r['cas1'][0]}:{r['cas1'][1]} kt  cas2={r['cas2'][0]}:{r['cas2'][1]} kt\n"
          f"         fl1={r['fl1'][0]}:{r['fl1'][1]}       fl2={r['fl2'][0]}:{r['fl2'][1]}\n"
          f"         brg1={r['brg1'][0]}:{r['brg1'][1]} deg   angle={r['angle'][0]}:{r['angle'][1]} deg\n"
          f" AC1={acid1} {ac1} brg={hdg1} cas={cas1:.1f} fl0={fl1_start}->CPA{fl_cpa1}\n"
-         f" AC2={acid2} {ac2} brg={hdg2} cas={cas2:.1f} fl0={fl2_start}->CPA{fl_cpa2}"),
-        nxt="Load: SATG_GC_RUN [SCNNAME]  |  Add more: SATG_GC_CRE name=<sameSCN> ...  |  Clean: SATG_GC_DEL"
-    )
+         f" AC2={acid2} {ac2} brg={hdg2} cas={cas2:.1f} fl0={fl2_start}->CPA{fl_cpa2}")
+
+def _open_gc_scn(out_path: str, append: bool, emit_header: Optional[bool] = None):
+    """Open a GC scenario for writing. The HOLD/ASAS header is written first when emit_header
+    is True, or by default (None) when a new file is started."""
+    fh = open(out_path, "a" if append else "w", encoding="utf-8", buffering=_SCN_BUFSIZE)
+    if (not append) if emit_header is None else emit_header:
+        fh.write("0:00:00.00>HOLD\n0:00:00.00>ASAS ON\n")
+    return fh
+
+def _echo_gc_summary(out_path: str, append: bool, summary: str):
+    act = "appended to" if append else "written"
+    _echo_ok(f"GC {act}: {out_path}\n" + summary,
+             nxt="Load: SATG_GC_RUN [SCNNAME]  |  Add more: SATG_GC_CRE name=<sameSCN> ...  |  Clean: SATG_GC_DEL")
+
+def _write_gc_scn(out_path: str, *, append: bool, emit_header: Optional[bool] = None, **conflict):
+    """Create or append one conflict to out_path (see _gc_conflict for the conflict args)."""
+    block, summary = _gc_conflict(**conflict)
+    with _open_gc_scn(out_path, append, emit_header) as fh:
+        fh.write(block)
+    _echo_gc_summary(out_path, append, summary)
 
 # ---------------- Stack commands (typed for console hints) ---------------- #
 @command
@@ -650,6 +848,37 @@ def SATG_RL_LOAD(files: str="AUTO"):
         _echo_err(msg)
     return ok, ""
 
+@command
+def SATG_RL_LOAD_BASE(folder: str):
+    """SATG_RL_LOAD_BASE folder
+    Start a staged load: file names given to SATG_RL_LOAD_APPEND are relative to folder.
+    """
+    STATE.load_base = folder.strip().strip('"').strip("'")
+    STATE.load_pending = []
+    return True, ""
+
+@command
+def SATG_RL_LOAD_APPEND(*names):
+    """SATG_RL_LOAD_APPEND name [name ...]
+    Add CSV files (relative to the SATG_RL_LOAD_BASE folder) to the staged load.
+    """
+    base = STATE.load_base
+    STATE.load_pending.extend(os.path.join(base, nm) for nm in names if nm)
+    return True, ""
+
+@command
+def SATG_RL_LOAD_COMMIT():
+    """SATG_RL_LOAD_COMMIT
+    Load the files staged with SATG_RL_LOAD_BASE / SATG_RL_LOAD_APPEND.
+    """
+    paths, STATE.load_pending = STATE.load_pending, []
+    ok, msg = _load_paths(paths)
+    if ok:
+        _echo_ok(msg, nxt="Now: SATG_RL_JITTER [on|off] … (optional), then SATG_RL_RUN [SCNNAME]")
+    else:
+        _echo_err(msg)
+    return ok, ""
+
 @command
 def SATG_RL_JITTER(mode: str,
                    dist: str=None,
@@ -702,10 +931,7 @@ def SATG_RL_JITTER(mode: str,
     # If we already have flights loaded, precompute a deterministic subset now
     # so selection is stable across runs given the same seed + percentage.
     if STATE.base_points:
-        acids = list(STATE.base_points.keys())
-        k = int(round((STATE.jitter_pct / 100.0) * len(acids)))
-        rng_sel = random.Random(STATE.j_seed) if STATE.j_seed is not None else random.Random()
-        STATE.jitter_subset = set(rng_sel.sample(acids, k)) if k > 0 else set()
+        STATE.jitter_subset = _pick_jitter_subset(list(STATE.base_points.keys()))
     else:
         STATE.jitter_subset = None  # compute later once data is loaded
 
@@ -736,13 +962,7 @@ def SATG_RL_MAKE(name: str, overwrite: int = 0):
     """
     if not STATE.loaded_ok:
         _echo_err("No data loaded. Run SATG_RL_LOAD first."); return False, ""
-    if not os.path.isdir(STATE.scn_dir): os.makedirs(STATE.scn_dir, exist_ok=True)
-    nm = name.strip()
-    if "=" in nm and nm.lower().startswith("name="): nm = nm.split("=",1)[1].strip()
-    out_path = os.path.join(STATE.scn_dir, f"{nm}.scn")
-    ow = int(overwrite)
-    exists = os.path.isfile(out_path)
-    append = (ow == 0) and exists
+    out_path, append = _resolve_scn_path(name, int(overwrite) != 0)
     _write_rl_scn(out_path, append=append)
     _echo_ok(f"Wrote scenario: {out_path}", nxt="Load it: SATG_RL_RUN [SCNNAME]")
     return True, ""
@@ -754,14 +974,7 @@ def SATG_RL_RUN(name: str, overwrite: int = 0):
     """
     if not STATE.loaded_ok:
         _echo_err("No data loaded. Run SATG_RL_LOAD first."); return False, ""
-    if not os.path.isdir(STATE.scn_dir): os.makedirs(STATE.scn_dir, exist_ok=True)
-    nm = name.strip()
-    if "=" in nm and nm.lower().startswith("name="): nm = nm.split("=",1)[1].strip()
-    out_path = os.path.abspath(os.path.join(STATE.scn_dir, f"{nm}.scn"))
-
-    ow = int(overwrite)
-    exists = os.path.isfile(out_path)
-    append = (ow == 0) and exists
+    out_path, append = _resolve_scn_path(name, int(overwrite) != 0)
     _write_rl_scn(out_path, append=append)
     stack.stack(f"IC {out_path}")
     _echo_ok(f"Scenario written and loaded: {out_path}",
@@ -829,42 +1042,29 @@ def SATG_GC_CRE(name: str, type: str, altmode: str, lat: float, lon: float, tcpa
       - If appending and you keep default callsigns (SC1/SC2), they are auto-bumped to next SC# pair.
     """
     typ = type.strip().lower()
-    if typ not in ("headon","cross","overtake"):
+    if typ not in _TYPES:
         _echo_err("SATG_GC_CRE: type must be headon|cross|overtake"); return False, ""
     am = altmode.strip().lower()
-    if am not in ("level","altcross"):
+    if am not in _ALTMODES:
         _echo_err("SATG_GC_CRE: altmode must be level|altcross"); return False, ""
 
-    if not os.path.isdir(STATE.scn_dir): os.makedirs(STATE.scn_dir, exist_ok=True)
-    nm = name.strip()
-    if "=" in nm and nm.lower().startswith("name="): nm = nm.split("=",1)[1].strip()
-    out_path = os.path.join(STATE.scn_dir, f"{nm}.scn")
-
-    # Overwrite handling
-    ow_raw = str(overwrite).strip()
-    if ow_raw not in ("0","1"):
+    out_path, append = _resolve_scn_path(name, overwrite)
+    if out_path is None:
         _echo_err("SATG_GC_CRE: overwrite must be 0 or 1"); return False, ""
-    ow_true = (ow_raw == "1")
-    exists = os.path.isfile(out_path)
-    append = False if ow_true else exists
-    if ow_true and exists:
-        try:
-            os.remove(out_path)
-        except Exception:
-            pass
 
     # Default ACIDs auto-increment when appending
     ac1_final, ac2_final = acid1, acid2
+    nmax = _max_sc_index(out_path) if append else 0  # 0 if none found
     if append and acid1 == "SC1" and acid2 == "SC2":
-        nmax = _scan_max_sc_index(out_path)  # 0 if none found
         ac1_final = f"SC{nmax + 1}"
         ac2_final = f"SC{nmax + 2}"
 
-    _write_gc_scn(out_path, append=append, name=nm,
+    _write_gc_scn(out_path, append=append,
               cpa_lat=float(lat), cpa_lon=float(lon), tcpa=float(tcpa),
               typ=typ, altmode=am, fl_cpa=fl_cpa,
               acid1=ac1_final, acid2=ac2_final, ac1=ac1, ac2=ac2,
               seed=seed, angle_in=angle)
+    _note_sc_written(out_path, nmax, (ac1_final, ac2_final))
 
     return True, ""
 
@@ -873,9 +1073,8 @@ def SATG_GC_RUN(name: str):
     """SATG_GC_RUN name
     Load the specified geometric-conflict scenario (paused; ASAS ON at 0 only in file header).
     """
-    nm = name.strip()
-    if "=" in nm and nm.lower().startswith("name="): nm = nm.split("=",1)[1].strip()
-    out_path = os.path.abspath(os.path.join(STATE.scn_dir, f"{nm}.scn"))
+    nm = _scn_name(name)
+    out_path = os.path.join(STATE.scn_dir, f"{nm}.scn")  # scn_dir is absolute (_init_dirs)
     if not os.path.isfile(out_path):
         _echo_err(f"Scenario not found: {out_path}. Run SATG_GC_CRE name={nm} ... first."); return False, ""
     stack.stack(f"IC {out_path}")
@@ -890,12 +1089,46 @@ def SATG_GC_DEL():
     """
     if not STATE.gc_last_acids:
         _echo_err("No geometric-conflict aircraft recorded to delete."); return False, ""
-    for acid in STATE.gc_last_acids:
-        stack.stack(f"DEL {acid}")
+    # One stack push; separate DEL lines so an already-removed ACID does not abort the rest
+    stack.stack(";".join(f"DEL {acid}" for acid in STATE.gc_last_acids))
     _echo_ok(f"Deleted aircraft: {', '.join(STATE.gc_last_acids)}")
     STATE.gc_last_acids = []
     return True, ""
 
+@contextmanager
+def _override_ranges(**ranges):
+    """Temporarily swap in a copy of STATE.gc_ranges with the given entries replaced.
+    The saved dict is never mutated, so it is restored exactly."""
+    saved = STATE.gc_ranges
+    STATE.gc_ranges = {**saved, **ranges}
+    try:
+        yield STATE.gc_ranges
+    finally:
+        STATE.gc_ranges = saved
+
+_RC_ORDER = ("name","n","types","center_lat","center_lon","radius_nm",
+             "altmode","tcpa","angle","seed","fl","cas","actypes","overwrite")
+
+def _parse_rc_circle(argv, order: Tuple[str, ...] = _RC_ORDER) -> Dict[str, str]:
+    """Single pass over RC_CIRCLE args: key=value tokens always win, bare tokens fill order."""
+    kv: Dict[str, str] = {}
+    pos_idx = 0
+    for tok in argv:
+        s = str(tok).strip()
+        if not s: continue
+        k, eq, v = s.partition("=")
+        if eq:
+            kv[k.strip().lower()] = v.strip()
+        else:
+            if pos_idx < len(order):
+                kv.setdefault(order[pos_idx], s)
+            pos_idx += 1
+    return kv
+
+# RC_CIRCLE places CPAs with flat-earth offsets below this radius (away from the poles)
+_RC_FLAT_MAX_NM = 200.0
+_RC_FLAT_MAX_LAT = 80.0
+
 @command
 def SATG_RC_CIRCLE(*argv):
     """SATG_RC_CIRCLE name n types center_lat center_lon radius_nm [altmode] [tcpa] [angle] [seed] [fl] [cas] [ac1] [ac2]
@@ -906,20 +1139,7 @@ def SATG_RC_CIRCLE(*argv):
     types: CSV from {headon,cross,overtake}
     altmode: level | altcross | mix
     """
-    # parse argv
-    order = ["name","n","types","center_lat","center_lon","radius_nm",
-         "altmode","tcpa","angle","seed","fl","cas","actypes","overwrite"]
-    kv, pos = {}, []
-    for tok in argv:
-        s = str(tok).strip()
-        if not s: continue
-        if "=" in s:
-            k, v = s.split("=",1); kv[k.strip().lower()] = v.strip()
-        else:
-            pos.append(s)
-    for i,p in enumerate(pos):
-        if i < len(order) and order[i] not in kv:
-            kv[order[i]] = p
+    kv = _parse_rc_circle(argv)
 
     def _get(k, default=None):
         v = kv.get(k, None)
@@ -945,11 +1165,11 @@ def SATG_RC_CIRCLE(*argv):
         _echo_err("SATG_RC_CIRCLE: n>0 and radius_nm>0 required"); return False, ""
 
     types = [t.strip().lower() for t in str(_get("types","headon,cross,overtake")).split(",") if t.strip()]
-    if not types or any(t not in {"headon","cross","overtake"} for t in types):
+    if not types or not _TYPES.issuperset(types):
         _echo_err("SATG_RC_CIRCLE: types must be CSV of headon,cross,overtake"); return False, ""
 
     altmode = str(_get("altmode","level")).lower()
-    if altmode not in ("level","altcross","mix"):
+    if altmode != "mix" and altmode not in _ALTMODES:
         _echo_err("SATG_RC_CIRCLE: altmode must be level|altcross|mix"); return False, ""
 
     tcpa_rng = _rng("tcpa", (60.0,240.0))
@@ -968,66 +1188,76 @@ def SATG_RC_CIRCLE(*argv):
         ac1_default = str(_get("ac1", "A320"))
         ac2_default = str(_get("ac2", "B738"))
         types_list = [ac1_default, ac2_default]  # if the user provided only ac1/ac2
+    actypes = tuple(types_list)
 
 
     # target filepath
-    if not os.path.isdir(STATE.scn_dir): os.makedirs(STATE.scn_dir, exist_ok=True)
-    nm = name if not name.lower().startswith("name=") else name.split("=",1)[1].strip()
-    out_path = os.path.join(STATE.scn_dir, f"{nm}.scn")
-    
-    ow_raw = str(_get("overwrite","0")).strip()
-    if ow_raw not in ("0","1"):
+    out_path, append = _resolve_scn_path(name, _get("overwrite","0"))
+    if out_path is None:
         _echo_err("SATG_RC_CIRCLE: overwrite must be 0 or 1"); return False, ""
-    ow_true = (ow_raw == "1")
-    exists = os.path.isfile(out_path)
-    append = False if ow_true else exists
-    if ow_true and exists:
-        try:
-            os.remove(out_path)
-        except Exception:
-            pass
 
     # temp override ranges
-    old = dict(STATE.gc_ranges)
-    try:
-        STATE.gc_ranges["cas1"] = cas_rng
-        STATE.gc_ranges["cas2"] = cas_rng
-        STATE.gc_ranges["fl1"]  = fl_rng
-        STATE.gc_ranges["fl2"]  = fl_rng
-        if angle_str is not None:
-            STATE.gc_ranges["angle"] = angle_rng
-
-        for _ in range(n):
+    overrides = dict(cas1=cas_rng, cas2=cas_rng, fl1=fl_rng, fl2=fl_rng)
+    if angle_str is not None:
+        overrides["angle"] = angle_rng
+    with _override_ranges(**overrides):
+
+        # Per-conflict draws in the same order as before, so a given seed reproduces
+        # earlier scenarios; only the CPA placement below is batched
+        typs: List[str] = []; ams: List[str] = []; tcpas: List[float] = []
+        angles: List[Optional[float]] = []; ac_pairs: List[Tuple[str, str]] = []
+        r = np.empty(n); theta = np.empty(n)
+        ang_lo, ang_hi = STATE.gc_ranges["angle"]
+        for i in range(n):
             typ = rng.choice(types)
-            am_i = rng.choice(["level","altcross"]) if altmode == "mix" else altmode
-            tcpa_i = _rand_in(rng, tcpa_rng[0], tcpa_rng[1])
-
+            typs.append(typ)
+            ams.append(rng.choice(_ALT_MIX) if altmode == "mix" else altmode)
+            tcpas.append(_rand_in(rng, tcpa_rng[0], tcpa_rng[1]))
             # CPA uniformly by area: r = R*sqrt(u), theta ~ U(0,360)
-            r = radius_nm * math.sqrt(rng.random())
-            theta = rng.uniform(0.0, 360.0)
-            cpa_lat, cpa_lon = _dest_nm(center_lat, center_lon, theta, r)
-
-            angle_i = None
-            if typ == "cross":
-                lo, hi = STATE.gc_ranges["angle"]
-                angle_i = _rand_in(rng, lo, hi)
-
-            if append:
-                nmax = _scan_max_sc_index(out_path)
-                acid1 = f"SC{nmax+1}"; acid2 = f"SC{nmax+2}"
-            else:
-                acid1, acid2 = "SC1","SC2"
-            
-            # Sample AC types uniformly for each aircraft
-            ac1 = rng.choice(types_list)
-            ac2 = rng.choice(types_list)
-
-            _write_gc_scn(out_path, append=append, name=nm,
-                          cpa_lat=cpa_lat, cpa_lon=cpa_lon, tcpa=float(tcpa_i),
-                          typ=typ, altmode=am_i, fl_cpa=None,
-                          acid1=acid1, acid2=acid2, ac1=ac1, ac2=ac2,
-                          seed=None, angle_in=angle_i)
-            append = True
+            r[i] = radius_nm * math.sqrt(rng.random())
+            theta[i] = rng.uniform(0.0, 360.0)
+            angles.append(_rand_in(rng, ang_lo, ang_hi) if typ == "cross" else None)
+            ac_pairs.append((rng.choice(actypes), rng.choice(actypes)))
+        # Centre trig is loop-invariant: evaluated once for the whole batch
+        cos_clat = math.cos(math.radians(center_lat))
+        if radius_nm < _RC_FLAT_MAX_NM and abs(center_lat) < _RC_FLAT_MAX_LAT:
+            # Small circle: equirectangular offsets (1 deg lat = 60 NM) are accurate enough
+            th = np.radians(theta)
+            cpa_lats = center_lat + r*np.cos(th)/60.0
+            cpa_lons = center_lon + r*np.sin(th)/(60.0*cos_clat)
+            cpa_lons = (cpa_lons + 540.0) % 360.0 - 180.0
+        elif hasattr(geo, "qdrpos"):
+            cpa_lats, cpa_lons = geo.qdrpos(center_lat, center_lon, theta, r)
+        else:
+            cpa_lats, cpa_lons = _dest_nm_fast(math.sin(math.radians(center_lat)), cos_clat,
+                                               center_lon, theta, r)
+        cpa_lats, cpa_lons = cpa_lats.tolist(), cpa_lons.tolist()
+
+        # Conflict blocks are generated lazily and streamed to the file by writelines;
+        # SC indices continue from the file's current maximum
+        nmax0 = _max_sc_index(out_path) if append else 0
+        summaries: List[str] = []
+
+        def _gen_conflict_blocks() -> Iterator[str]:
+            # Per-conflict values come straight from the pre-drawn lists; helpers bound as locals
+            gc_conflict = _gc_conflict; add_summary = summaries.append
+            k = nmax0
+            for typ, am_i, lat_i, lon_i, tcpa_i, ang_i, (ac1, ac2) in zip(
+                    typs, ams, cpa_lats, cpa_lons, tcpas, angles, ac_pairs):
+                block, summary = gc_conflict(cpa_lat=lat_i, cpa_lon=lon_i, tcpa=tcpa_i,
+                                             typ=typ, altmode=am_i, fl_cpa=None,
+                                             acid1=f"SC{k+1}", acid2=f"SC{k+2}", ac1=ac1, ac2=ac2,
+                                             seed=None, angle_in=ang_i)
+                k += 2
+                add_summary(summary)
+                yield block
+
+        # Header at most once for the whole batch, never per conflict
+        with _open_gc_scn(out_path, append, emit_header=not append) as fh:
+            fh.writelines(_gen_conflict_blocks())
+        _note_sc_written(out_path, nmax0 + 2*n)
+        for i, summary in enumerate(summaries):
+            _echo_gc_summary(out_path, append or i > 0, summary)
 
         _echo_ok(
             f"RC-CIRCLE wrote {n} conflicts to {out_path}\n"
@@ -1036,8 +1266,6 @@ def SATG_RC_CIRCLE(*argv):
             f" FL={fl_rng[0]}:{fl_rng[1]}  CAS={cas_rng[0]:.0f}:{cas_rng[1]:.0f} kt",
             nxt="Load: SATG_GC_RUN [SCNNAME]"
         )
-    finally:
-        STATE.gc_ranges = old
     return True, ""
 
 def init_plugin():
@@ -3,34 +3,191 @@
 #
 # PyQt6; lazy window creation to avoid QApplication race.
 
-from PyQt6.QtCore import Qt
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from PyQt6.QtCore import QTimer, QRegularExpression, QSignalBlocker
+from PyQt6.QtGui import QRegularExpressionValidator
 from PyQt6.QtWidgets import (
     QWidget, QTabWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
     QLabel, QLineEdit, QCheckBox, QComboBox, QPushButton, QSpinBox,
-    QDoubleSpinBox, QFileDialog, QSlider
+    QDoubleSpinBox, QFileDialog, QApplication
 )
 from bluesky import stack
 
 # --- helpers ---------------------------------------------------------------
 
-def _emit(cmd: str):
-    """Send a BlueSky console command (no GUI echo here)."""
-    stack.stack(cmd)
+# Commands are queued and handed to the stack in one call, either at the end
+# of a _batch_emit() block or on the next event-loop turn.
+_emit_queue = []
+_emit_hold = 0
+_flush_pending = False
+
+# Settings commands that are idempotent: a repeat within one queued batch is
+# dropped if it matches the latest queued command with the same verb.
+# Anything that writes or runs scenarios is never deduplicated.
+_DEDUP_VERBS = frozenset({"SATG_RL_AUTODEL", "SATG_RL_JITTER", "SATG_GC_CONF", "SATG_GC_RANGE"})
+_emit_last = {}   # verb -> latest queued command, for the current batch
+
+def _flush_emits():
+    global _flush_pending
+    _flush_pending = False
+    if _emit_hold or not _emit_queue:
+        return
+    cmds = _emit_queue[:]
+    _emit_queue.clear()
+    _emit_last.clear()
+    stack.stack(*cmds)
 
+def _emit(cmd: str):
+    """Queue a BlueSky console command (no GUI echo here)."""
+    global _flush_pending
+    verb = cmd.split(None, 1)[0] if cmd else ""
+    if verb in _DEDUP_VERBS:
+        if _emit_last.get(verb) == cmd:
+            return
+        _emit_last[verb] = cmd
+    _emit_queue.append(cmd)
+    if not _emit_hold and not _flush_pending:
+        _flush_pending = True
+        QTimer.singleShot(0, _flush_emits)
+
+@contextmanager
+def _batch_emit():
+    """Hold back emitted commands and flush them together on exit."""
+    global _emit_hold
+    _emit_hold += 1
+    try:
+        yield
+    finally:
+        _emit_hold -= 1
+        if not _emit_hold:
+            _flush_emits()
+
+def _emit_batch(*cmds):
+    """Emit the given non-empty commands as one stack submission."""
+    with _batch_emit():
+        for cmd in filter(None, cmds):
+            _emit(cmd)
+
+# Above this many picked CSVs, try to load their folder instead of listing them.
+_LOAD_DIR_MIN = 100
+# File names per SATG_RL_LOAD_APPEND command when loading an explicit list.
+_LOAD_CHUNK = 500
+
+# Skip symlink resolution and per-entry icon lookups; both stat every file,
+# which is slow on network-mounted data folders. The Qt dialog (not the
+# native one) also keeps its directory model warm between reuses.
+_DIALOG_OPTS = (QFileDialog.Option.DontUseNativeDialog
+                | QFileDialog.Option.DontResolveSymlinks
+                | QFileDialog.Option.DontUseCustomDirectoryIcons)
+
+# One validator shared by every lat/lon text field (signed decimal degrees).
+_coord_validator = None
+
+def _coord_validator_shared():
+    global _coord_validator
+    if _coord_validator is None:
+        _coord_validator = QRegularExpressionValidator(QRegularExpression(r"^-?\d{1,3}(\.\d*)?$"))
+    return _coord_validator
+
+@lru_cache(maxsize=256)
 def _qpath(path: str) -> str:
     if not path:
         return path
     return f"\"{path}\"" if (" " in path and not (path.startswith('"') and path.endswith('"'))) else path
 
-def _kv(key: str, val):
-    if val is None:
-        return ""
-    if isinstance(val, str) and val.strip() == "":
-        return ""
-    return f"{key}={val}"
+def _kv_str(key: str, val: str) -> str:
+    """'key=val' for a text value, or '' when blank. Numeric values are formatted inline."""
+    return f"{key}={val}" if val and not val.isspace() else ""
+
+def _opt_kv(key: str, val: str) -> str:
+    """' key=val' for a free-text field, or '' when it was left blank."""
+    return f" {key}={val}" if val else ""
+
+def _link_range(lo, hi):
+    """Keep lo <= hi on a pair of spin boxes, updated once per committed edit."""
+    lo.editingFinished.connect(lambda: hi.setMinimum(lo.value()))
+    hi.editingFinished.connect(lambda: lo.setMaximum(hi.value()))
+
+def _range_val(lo, hi, what: str) -> str:
+    """'lo:hi' from a linked spin-box pair; swaps (with a warning) if out of order,
+    since arrow-key steps do not fire editingFinished."""
+    a, b = lo.value(), hi.value()
+    if a > b:
+        _emit(f"ECHO SATGGUI: {what} range {a}:{b} reversed; using {b}:{a}.")
+        a, b = b, a
+    return f"{a}:{b}"
 
 def _join_tokens(*tokens):
-    return " ".join([t for t in tokens if t])
+    return " ".join(filter(None, tokens))
+
+# Button labels, shared by the tabs.
+_BTN_BROWSE     = "Browse Base Folder"
+_BTN_SHOW       = "Show Paths"
+_BTN_HELP       = "SATG_HELP"
+_BTN_RESET      = "Reset"
+_BTN_ADD_FILES  = "(Optionally) Add files manually"
+_BTN_LOAD       = "LOAD FILES"
+_BTN_CREATE     = "CREATE SCENARIO"
+_BTN_RUN        = "RUN SCENARIO"
+_BTN_CREATE_RUN = "CREATE & RUN SCENARIO"
+
+# --- shared widgets --------------------------------------------------------
+
+def _spin(lo, hi, value, decimals=None):
+    """Configured spin box: QSpinBox, or QDoubleSpinBox when decimals is given."""
+    if decimals is None:
+        w = QSpinBox()
+    else:
+        w = QDoubleSpinBox(); w.setDecimals(decimals)
+    w.setRange(lo, hi)
+    w.setValue(value)
+    return w
+
+# Descriptive hint labels carry a "hint" property; SATGWindow styles them all
+# with one stylesheet rule instead of a per-label setStyleSheet().
+_HINT_STYLE = 'QLabel[hint="true"] { color: #666; font-style: italic; }'
+
+def _hint_label(text: str) -> QLabel:
+    lab = QLabel(text)
+    lab.setProperty("hint", True)
+    return lab
+
+# Backend defaults for the GC separation minima (SATG_GC_CONF)
+_HSEP_DEFAULT = 5.0
+_VSEP_DEFAULT = 1000
+
+class SepMinimaBox(QGroupBox):
+    """Collapsible HSEP/VSEP inputs; the spin boxes are only built on first expand."""
+    def __init__(self, parent=None):
+        super().__init__("Advanced: separation minima", parent)
+        self.setCheckable(True)
+        self.setChecked(False)
+        self._body = None
+        self.hsep = self.vsep = None
+        QVBoxLayout(self)
+        self.toggled.connect(self._on_toggled)
+
+    def _on_toggled(self, on: bool):
+        if on and self._body is None:
+            self._body = QWidget(); f = QFormLayout(self._body); f.setContentsMargins(0,0,0,0)
+            self.hsep = _spin(0.1, 50.0, _HSEP_DEFAULT, decimals=2)
+            self.vsep = _spin(100, 5000, _VSEP_DEFAULT)
+            f.addRow("HSEP [NM]:", self.hsep)
+            f.addRow("VSEP [ft]:", self.vsep)
+            self.layout().addWidget(self._body)
+        if self._body is not None:
+            self._body.setVisible(on)
+
+    def values(self):
+        """(hsep, vsep); backend defaults while the box is unchecked (edits are kept for re-enable)."""
+        if not self.isChecked() or self.hsep is None:
+            return _HSEP_DEFAULT, _VSEP_DEFAULT
+        return self.hsep.value(), self.vsep.value()
 
 # --- top strip -------------------------------------------------------------
 
@@ -40,10 +197,10 @@ class TopStrip(QWidget):
         super().__init__(parent)
         lay = QHBoxLayout(self)
 
-        btn_browse = QPushButton("Browse Base Folder", self)
-        btn_show = QPushButton("Show Paths", self)
-        btn_help = QPushButton("SATG_HELP", self)
-        btn_reset = QPushButton("Reset", self)
+        btn_browse = QPushButton(_BTN_BROWSE, self)
+        btn_show = QPushButton(_BTN_SHOW, self)
+        btn_help = QPushButton(_BTN_HELP, self)
+        btn_reset = QPushButton(_BTN_RESET, self)
         btn_reset.setToolTip("Full BlueSky reset")
 
         lay.addWidget(btn_browse)
@@ -52,15 +209,27 @@ class TopStrip(QWidget):
         lay.addStretch(1)
         lay.addWidget(btn_reset)
 
+        # file dialog kept across clicks so its directory model stays warm
+        self._dir_dialog = None
         btn_browse.clicked.connect(self._choose_base)
-        btn_show.clicked.connect(lambda: _emit("SATG_DIR"))
-        btn_help.clicked.connect(lambda: _emit("SATG_HELP"))
-        btn_reset.clicked.connect(lambda: _emit("RESET"))
+        # fixed-command buttons share one slot; the command rides on the button
+        for btn, cmd in ((btn_show, "SATG_DIR"), (btn_help, "SATG_HELP"), (btn_reset, "RESET")):
+            btn.setProperty("satg_cmd", cmd)
+            btn.clicked.connect(self._emit_from_sender)
+
+    def _emit_from_sender(self):
+        _emit(self.sender().property("satg_cmd"))
 
     def _choose_base(self):
-        path = QFileDialog.getExistingDirectory(self, "Choose SATG base directory")
-        if path:
-            _emit(_join_tokens("SATG_DIR", _qpath(path)))
+        if self._dir_dialog is None:
+            dlg = QFileDialog(self, "Choose SATG base directory")
+            dlg.setFileMode(QFileDialog.FileMode.Directory)
+            dlg.setOptions(QFileDialog.Option.ShowDirsOnly | _DIALOG_OPTS)
+            self._dir_dialog = dlg
+        if self._dir_dialog.exec():
+            path = self._dir_dialog.selectedFiles()[0]
+            if path:
+                _emit(_join_tokens("SATG_DIR", _qpath(path)))
 
 # --- RL tab (Realistic Replay) --------------------------------------------
 
@@ -73,16 +242,16 @@ class RLTab(QWidget):
         # 1) Load (Required)
         gb_load = QGroupBox("1) Load data - Required")
         fl = QFormLayout(gb_load)
-        desc1 = QLabel("Load aircraft tracks from selected path")
-        desc1.setStyleSheet("color: #666; font-style: italic;")
+        desc1 = _hint_label("Load aircraft tracks from selected path")
         self.opt_auto = QCheckBox("Use AUTO folder (./satg_data/data)")
         self.opt_auto.setChecked(True)
 
-        btn_file = QPushButton("(Optionally) Add files manually")
+        btn_file = QPushButton(_BTN_ADD_FILES)
         self._chosen_files = []  # internal list of selected CSV files
+        self._file_dialog = None  # reused across clicks, built on first use
         btn_file.clicked.connect(self._pick_files)
 
-        btn_load = QPushButton("LOAD FILES")
+        btn_load = QPushButton(_BTN_LOAD)
 
         fl.addRow(desc1)
         fl.addRow(self.opt_auto)
@@ -94,53 +263,47 @@ class RLTab(QWidget):
         # 2) Jitter (Optional)
         gb_j = QGroupBox("2) Jitter - Optional")
         fj = QFormLayout(gb_j)
-        desc2 = QLabel("Apply noise to time/position/FL")
-        desc2.setStyleSheet("color: #666; font-style: italic;")
+        desc2 = _hint_label("Apply noise to time/position/FL")
 
         self.j_on = QCheckBox("Enable jitter"); self.j_on.setChecked(False)
         self.j_dist = QComboBox(); self.j_dist.addItems(["uniform", "normal"])
         self.j_seed = QSpinBox(); self.j_seed.setRange(-2**31, 2**31-1); self.j_seed.setSpecialValueText("")
         self.j_seed.setValue(0)
 
-        self.j_dt   = QDoubleSpinBox(); self.j_dt.setDecimals(3); self.j_dt.setRange(0.0, 1e6); self.j_dt.setValue(0.0)
-        self.j_dlat = QDoubleSpinBox(); self.j_dlat.setDecimals(6); self.j_dlat.setRange(0.0, 10.0); self.j_dlat.setValue(0.0)
-        self.j_dlon = QDoubleSpinBox(); self.j_dlon.setDecimals(6); self.j_dlon.setRange(0.0, 10.0); self.j_dlon.setValue(0.0)
-        self.j_dfl  = QSpinBox();       self.j_dfl.setRange(0, 5000); self.j_dfl.setValue(0)
-        self.j_nsig = QDoubleSpinBox(); self.j_nsig.setDecimals(2); self.j_nsig.setRange(0.0, 10.0); self.j_nsig.setValue(0.0)
+        self.j_dt = _spin(0.0, 1e6, 0.0, decimals=3)
+        self.j_dlat = _spin(0.0, 10.0, 0.0, decimals=6)
+        self.j_dlon = _spin(0.0, 10.0, 0.0, decimals=6)
+        self.j_dfl = _spin(0, 5000, 0)
+        self.j_nsig = _spin(0.0, 10.0, 0.0, decimals=2)
 
-        self.j_pct = QSlider(Qt.Orientation.Horizontal)
-        self.j_pct.setRange(0, 100)
-        self.j_pct.setValue(100)     
-        self.j_pct.setSingleStep(1)
-        self.j_pct_label = QLabel("100%")
-        self.j_pct.valueChanged.connect(lambda v: self.j_pct_label.setText(f"{v}%"))
+        self.j_pct = _spin(0, 100, 100); self.j_pct.setSuffix("%")
 
         fj.addRow(desc2)
         fj.addRow(self.j_on)
-        fj.addRow("dist:", self.j_dist)
-        fj.addRow("seed:", self.j_seed)
-        fj.addRow("dt [s]:", self.j_dt)
-        fj.addRow("dlat [deg]:", self.j_dlat)
-        fj.addRow("dlon [deg]:", self.j_dlon)
-        fj.addRow("dfl [FL]:", self.j_dfl)
-        fj.addRow("nsig (normal):", self.j_nsig)
-        row_pct = QWidget(); hb_pct = QHBoxLayout(row_pct); hb_pct.setContentsMargins(0,0,0,0)
-        hb_pct.addWidget(self.j_pct, 1); hb_pct.addWidget(self.j_pct_label)
-        fj.addRow("Jitter % of flights:", row_pct)
+        for label, w in (
+            ("dist:", self.j_dist),
+            ("seed:", self.j_seed),
+            ("dt [s]:", self.j_dt),
+            ("dlat [deg]:", self.j_dlat),
+            ("dlon [deg]:", self.j_dlon),
+            ("dfl [FL]:", self.j_dfl),
+            ("nsig (normal):", self.j_nsig),
+        ):
+            fj.addRow(label, w)
+        fj.addRow("Jitter % of flights:", self.j_pct)
 
         # 3) Run (Required)
         gb_run = QGroupBox("3) Run - Required")
         fr = QFormLayout(gb_run)
-        desc3 = QLabel("Select overwrite or not, Set auto-deletion, create scenario file or run directly; press Play in BlueSky.")
-        desc3.setStyleSheet("color: #666; font-style: italic;")
+        desc3 = _hint_label("Select overwrite or not, Set auto-deletion, create scenario file or run directly; press Play in BlueSky.")
 
         self.autodel_chk = QCheckBox("Auto-delete at last waypoint"); self.autodel_chk.setChecked(True)
 
         self.scn_name = QLineEdit(); self.scn_name.setPlaceholderText("Scenario name, e.g. replay_01")
         self.rl_overwrite = QCheckBox("Overwrite scenario if it exists")
 
-        btn_make = QPushButton("CREATE SCENARIO")
-        btn_run  = QPushButton("CREATE & RUN SCENARIO")
+        btn_make = QPushButton(_BTN_CREATE)
+        btn_run  = QPushButton(_BTN_CREATE_RUN)
 
         hb_make = QHBoxLayout(); hb_make.addWidget(self.scn_name, 1); hb_make.addWidget(btn_make); hb_make.addWidget(btn_run)
 
@@ -159,67 +322,93 @@ class RLTab(QWidget):
         main.addStretch(1)
 
     def _pick_files(self):
-        files, _ = QFileDialog.getOpenFileNames(
-            self, "Choose CSV files", filter="CSV files (*.csv);All files (*)"
-        )
+        if self._file_dialog is None:
+            dlg = QFileDialog(self, "Choose CSV files")
+            dlg.setFileMode(QFileDialog.FileMode.ExistingFiles)
+            dlg.setNameFilters(["CSV files (*.csv)", "All files (*)"])
+            dlg.setOptions(_DIALOG_OPTS)
+            self._file_dialog = dlg
+        if not self._file_dialog.exec():
+            return
+        files = self._file_dialog.selectedFiles()
         if files:
             self._chosen_files = files[:]     # store internally
-            self.opt_auto.setChecked(False)   # switch off AUTO if user picked files
+            with QSignalBlocker(self.opt_auto):
+                self.opt_auto.setChecked(False)   # switch off AUTO if user picked files
 
 
     def _load(self):
         if self.opt_auto.isChecked() or not self._chosen_files:
             _emit("SATG_RL_LOAD AUTO")
             return
-        # Join full paths with commas (no quotes needed; BlueSky supports raw CSV list)
-        _emit("SATG_RL_LOAD " + ",".join(self._chosen_files))
+        files = self._chosen_files
+        if len(files) > _LOAD_DIR_MIN:
+            folder = self._common_csv_dir(files)
+            if folder:
+                _emit("SATG_RL_LOAD " + _qpath(folder))
+                return
+        # Staged load: one base folder, then bounded chunks of relative names
+        dirs = {os.path.dirname(f) for f in files}
+        try:
+            base = os.path.commonpath(dirs)
+        except ValueError:   # e.g. different drives; names stay absolute
+            base = ""
+        rel = [_qpath(os.path.relpath(f, base)) if base else _qpath(f) for f in files]
+        _emit_batch(
+            f"SATG_RL_LOAD_BASE {_qpath(base)}" if base else "SATG_RL_LOAD_BASE \"\"",
+            *(f"SATG_RL_LOAD_APPEND {','.join(rel[i:i + _LOAD_CHUNK])}"
+              for i in range(0, len(rel), _LOAD_CHUNK)),
+            "SATG_RL_LOAD_COMMIT",
+        )
 
-    def _emit_jitter_if_needed(self):
-        if not hasattr(self, "j_on"):
-            return
+    @staticmethod
+    def _common_csv_dir(files):
+        """Folder holding exactly the picked CSVs, or None.
+
+        SATG_RL_LOAD on a folder loads every *.csv in it, so the shortcut is
+        only taken when that set matches the selection.
+        """
+        folders = {os.path.dirname(f) for f in files}
+        if len(folders) != 1:
+            return None
+        folder = folders.pop()
+        try:
+            with os.scandir(folder) as it:
+                csvs = {os.path.normcase(e.path) for e in it if e.name.lower().endswith(".csv")}
+        except OSError:
+            return None
+        return folder if csvs == {os.path.normcase(f) for f in files} else None
 
+    def _emit_jitter_if_needed(self):
         if not self.j_on.isChecked():
-            _emit("SATG_RL_JITTER off")
-            return
-
-        # Collect values (positional order)
-        mode = "on"
-        dist = self.j_dist.currentText() if hasattr(self, "j_dist") else "normal"
-
-        # Use zeros for unset numeric fields so the parser is happy and backend treats them as no-noise.
-        seed = int(self.j_seed.value()) if hasattr(self, "j_seed") else 0
-        dt   = float(self.j_dt.value())   if hasattr(self, "j_dt")   else 0.0
-        dlat = float(self.j_dlat.value()) if hasattr(self, "j_dlat") else 0.0
-        dlon = float(self.j_dlon.value()) if hasattr(self, "j_dlon") else 0.0
-        dfl  = int(self.j_dfl.value())    if hasattr(self, "j_dfl")  else 0
-        nsig = float(self.j_nsig.value()) if hasattr(self, "j_nsig") else 0.0
-        pct  = int(self.j_pct.value())    if hasattr(self, "j_pct")  else 100
-
-        # Build a strictly positional command; no key=value anywhere.
-        cmd = f"SATG_RL_JITTER {mode} {dist} {seed} {dt} {dlat} {dlon} {dfl} {nsig} {pct}"
+            cmd = "SATG_RL_JITTER off"
+        else:
+            # Strictly positional command; no key=value anywhere. Unset numeric
+            # fields are zeros, which the backend treats as no-noise.
+            cmd = (f"SATG_RL_JITTER on {self.j_dist.currentText()} {self.j_seed.value()} "
+                   f"{self.j_dt.value():.10g} {self.j_dlat.value():.10g} {self.j_dlon.value():.10g} "
+                   f"{self.j_dfl.value()} {self.j_nsig.value():.10g} {self.j_pct.value()}")
         _emit(cmd)
 
     def _emit_autodel_from_toggle(self):
         """Emit SATG_RL_AUTODEL based on the checkbox state."""
         _emit("SATG_RL_AUTODEL " + ("on" if self.autodel_chk.isChecked() else "off"))
 
-    def _make(self):
+    def _emit_make_or_run(self, verb: str):
         name = self.scn_name.text().strip()
         if not name:
             return
-        self._emit_autodel_from_toggle()
-        self._emit_jitter_if_needed()
         ow = 1 if self.rl_overwrite.isChecked() else 0
-        _emit(f"SATG_RL_MAKE {name} {ow}")   # positional overwrite flag
+        with _batch_emit():
+            self._emit_autodel_from_toggle()
+            self._emit_jitter_if_needed()
+            _emit(f"{verb} {name} {ow}")   # positional overwrite flag
+
+    def _make(self):
+        self._emit_make_or_run("SATG_RL_MAKE")
 
     def _run(self):
-        name = self.scn_name.text().strip()
-        if not name:
-            return
-        self._emit_autodel_from_toggle()
-        self._emit_jitter_if_needed()
-        ow = 1 if self.rl_overwrite.isChecked() else 0
-        _emit(f"SATG_RL_RUN {name} {ow}")    # positional overwrite flag
+        self._emit_make_or_run("SATG_RL_RUN")
 
 
 # --- GC tab (Geometric Conflicts) ------------------------------------------
@@ -245,6 +434,12 @@ class GCTab(QWidget):
         hb_types.addWidget(self.gc_headon); hb_types.addWidget(self.gc_cross); hb_types.addWidget(self.gc_overtk); hb_types.addStretch(1)
         f1.addRow("Types:", types_box)
 
+        # types CSV is rebuilt only when a type checkbox changes (as in RCTab)
+        self._gc_types_csv_cache = ""
+        for cb in (self.gc_headon, self.gc_cross, self.gc_overtk):
+            cb.toggled.connect(self._recompute_gc_types_csv)
+        self._recompute_gc_types_csv()
+
         # Alt mode (checkboxes)
         alt_row = QWidget(); alt_hb = QHBoxLayout(alt_row); alt_hb.setContentsMargins(0,0,0,0)
         self.gc_alt_level    = QCheckBox("Level");     self.gc_alt_level.setChecked(True)
@@ -253,18 +448,16 @@ class GCTab(QWidget):
         f1.addRow("Alt mode:", alt_row)
 
         # TCPA [s]
-        self.gc_tcpa = QDoubleSpinBox(); self.gc_tcpa.setDecimals(0); self.gc_tcpa.setRange(10, 3600); self.gc_tcpa.setValue(120)
+        self.gc_tcpa = _spin(10, 3600, 120)
         f1.addRow("TCPA [s]:", self.gc_tcpa)
 
         # Angle [deg] (cross only)
-        self.gc_angle = QDoubleSpinBox(); self.gc_angle.setDecimals(0); self.gc_angle.setRange(0, 180); self.gc_angle.setValue(90)
+        self.gc_angle = _spin(0, 180, 90)
         f1.addRow("Cross angle [deg] (cross only):", self.gc_angle)
 
-        # Separation minima (HSEP/VSEP)
-        self.gc_hsep = QDoubleSpinBox(); self.gc_hsep.setRange(0.1, 50.0); self.gc_hsep.setDecimals(2); self.gc_hsep.setValue(5.0)
-        self.gc_vsep = QSpinBox();       self.gc_vsep.setRange(100, 5000);  self.gc_vsep.setValue(1000)
-        f1.addRow("HSEP [NM]:", self.gc_hsep)
-        f1.addRow("VSEP [ft]:", self.gc_vsep)
+        # Separation minima (HSEP/VSEP), collapsed by default
+        self.gc_sep = SepMinimaBox()
+        f1.addRow(self.gc_sep)
 
         # Overwrite toggle (checkbox -> 0/1 when emitting)
         self.gc_overwrite_cb = QCheckBox("Overwrite scenario if it exists")
@@ -274,10 +467,8 @@ class GCTab(QWidget):
         main.addWidget(gb1)
 
         # enable angle only when Crossing is selected
-        def _upd_angle_enabled():
-            self.gc_angle.setEnabled(self.gc_cross.isChecked())
-        self.gc_cross.toggled.connect(lambda _: _upd_angle_enabled())
-        _upd_angle_enabled()
+        self.gc_cross.toggled.connect(self.gc_angle.setEnabled)
+        self.gc_angle.setEnabled(self.gc_cross.isChecked())
 
         # -------- 2) CPA & ranges (match RC "region" section) --------
         gb2 = QGroupBox("2) CPA & ranges")
@@ -286,23 +477,23 @@ class GCTab(QWidget):
         # CPA lat/lon
         self.gc_lat = QLineEdit("52.100000")
         self.gc_lon = QLineEdit("4.500000")
+        self.gc_lat.setValidator(_coord_validator_shared())
+        self.gc_lon.setValidator(_coord_validator_shared())
         f2.addRow("CPA lat [deg]:", self.gc_lat)
         f2.addRow("CPA lon [deg]:", self.gc_lon)
 
         # FL range
-        self.gc_fl_lo = QDoubleSpinBox(); self.gc_fl_lo.setDecimals(0); self.gc_fl_lo.setRange(0, 450); self.gc_fl_lo.setValue(290)
-        self.gc_fl_hi = QDoubleSpinBox(); self.gc_fl_hi.setDecimals(0); self.gc_fl_hi.setRange(0, 450); self.gc_fl_hi.setValue(370)
-        self.gc_fl_lo.valueChanged.connect(lambda v: self.gc_fl_hi.setMinimum(v))
-        self.gc_fl_hi.valueChanged.connect(lambda v: self.gc_fl_lo.setMaximum(v))
+        self.gc_fl_lo = _spin(0, 450, 290)
+        self.gc_fl_hi = _spin(0, 450, 370)
+        _link_range(self.gc_fl_lo, self.gc_fl_hi)
         row_fl = QWidget(); hb_fl = QHBoxLayout(row_fl); hb_fl.setContentsMargins(0,0,0,0)
         hb_fl.addWidget(self.gc_fl_lo); hb_fl.addWidget(QLabel(" to ")); hb_fl.addWidget(self.gc_fl_hi)
         f2.addRow("FL range (lo:hi):", row_fl)
 
         # CAS range
-        self.gc_cas_lo = QDoubleSpinBox(); self.gc_cas_lo.setDecimals(0); self.gc_cas_lo.setRange(100, 600); self.gc_cas_lo.setValue(220)
-        self.gc_cas_hi = QDoubleSpinBox(); self.gc_cas_hi.setDecimals(0); self.gc_cas_hi.setRange(100, 600); self.gc_cas_hi.setValue(280)
-        self.gc_cas_lo.valueChanged.connect(lambda v: self.gc_cas_hi.setMinimum(v))
-        self.gc_cas_hi.valueChanged.connect(lambda v: self.gc_cas_lo.setMaximum(v))
+        self.gc_cas_lo = _spin(100, 600, 220)
+        self.gc_cas_hi = _spin(100, 600, 280)
+        _link_range(self.gc_cas_lo, self.gc_cas_hi)
         row_cas = QWidget(); hb_cas = QHBoxLayout(row_cas); hb_cas.setContentsMargins(0,0,0,0)
         hb_cas.addWidget(self.gc_cas_lo); hb_cas.addWidget(QLabel(" to ")); hb_cas.addWidget(self.gc_cas_hi)
         f2.addRow("CAS range [kt] (lo:hi):", row_cas)
@@ -313,9 +504,9 @@ class GCTab(QWidget):
         gb3 = QGroupBox("3) Actions")
         f3 = QFormLayout(gb3)
 
-        btn_cre  = QPushButton("CREATE SCENARIO")
-        btn_run  = QPushButton("RUN SCENARIO")
-        btn_both = QPushButton("CREATE & RUN SCENARIO")
+        btn_cre  = QPushButton(_BTN_CREATE)
+        btn_run  = QPushButton(_BTN_RUN)
+        btn_both = QPushButton(_BTN_CREATE_RUN)
         row_act = QWidget(); hb_act = QHBoxLayout(row_act); hb_act.setContentsMargins(0,0,0,0)
         hb_act.addWidget(btn_cre); hb_act.addWidget(btn_run); hb_act.addWidget(btn_both)
         f3.addRow(row_act)
@@ -330,15 +521,18 @@ class GCTab(QWidget):
         
 
     # ---------- helpers ----------
-    def _gc_types_csv(self) -> str:
+    def _recompute_gc_types_csv(self, *_):
         sel = []
         if self.gc_headon.isChecked(): sel.append("headon")
         if self.gc_cross.isChecked():  sel.append("cross")
         if self.gc_overtk.isChecked(): sel.append("overtake")
-        return ",".join(sel)
+        self._gc_types_csv_cache = ",".join(sel)
+
+    def _gc_types_csv(self) -> str:
+        return self._gc_types_csv_cache
 
     def _gc_ensure_types(self) -> bool:
-        if self.gc_headon.isChecked() or self.gc_cross.isChecked() or self.gc_overtk.isChecked():
+        if self._gc_types_csv_cache:
             return True
         _emit("ECHO Please select at least one conflict type.")
         return False
@@ -353,13 +547,13 @@ class GCTab(QWidget):
 
     # ---------- emitters ----------
     def _emit_gc_conf(self):
-        _emit(f"SATG_GC_CONF {self.gc_hsep.value()} {self.gc_vsep.value()}")
+        hsep, vsep = self.gc_sep.values()
+        _emit(f"SATG_GC_CONF {hsep} {vsep}")
 
     def _emit_gc_range(self):
-        fl_lo, fl_hi   = int(self.gc_fl_lo.value()),  int(self.gc_fl_hi.value())
-        cas_lo, cas_hi = int(self.gc_cas_lo.value()), int(self.gc_cas_hi.value())
-        toks = ["SATG_GC_RANGE", _kv("fl", f"{fl_lo}:{fl_hi}"), _kv("cas", f"{cas_lo}:{cas_hi}")]
-        _emit(_join_tokens(*toks))
+        fl  = _range_val(self.gc_fl_lo,  self.gc_fl_hi,  "FL")
+        cas = _range_val(self.gc_cas_lo, self.gc_cas_hi, "CAS")
+        _emit(f"SATG_GC_RANGE fl={fl} cas={cas}")
 
     def _emit_gc_cre(self):
         if not self._gc_ensure_types():
@@ -370,28 +564,24 @@ class GCTab(QWidget):
             return
         types_csv = self._gc_types_csv()
         altmode   = self._gc_altmode()
+        lat       = self.gc_lat.text().strip()
+        lon       = self.gc_lon.text().strip()
+        tcpa      = self.gc_tcpa.value()
         ow        = 1 if self.gc_overwrite_cb.isChecked() else 0
 
-        toks = [
-            "SATG_GC_CRE",
-            _kv("name",   name),
-            _kv("typ",    types_csv),
-            _kv("altmode", altmode),
-            _kv("lat",    self.gc_lat.text().strip()),
-            _kv("lon",    self.gc_lon.text().strip()),
-            _kv("tcpa",   int(self.gc_tcpa.value())),
-            _kv("overwrite", ow),
-        ]
-        if "cross" in {t.strip() for t in types_csv.split(",") if t.strip()}:
-            toks.append(_kv("angle", int(self.gc_angle.value())))
-        _emit(_join_tokens(*toks))
+        cmd = (f"SATG_GC_CRE name={name} typ={types_csv} altmode={altmode}"
+               f"{_opt_kv('lat', lat)}{_opt_kv('lon', lon)} tcpa={tcpa} overwrite={ow}")
+        if self.gc_cross.isChecked():
+            cmd += f" angle={self.gc_angle.value()}"
+        _emit(cmd)
 
     # ---------- actions ----------
     def _gc_create(self):
         # Push minima and ranges first, then create (like RC)
-        self._emit_gc_conf()
-        self._emit_gc_range()
-        self._emit_gc_cre()
+        with _batch_emit():
+            self._emit_gc_conf()
+            self._emit_gc_range()
+            self._emit_gc_cre()
 
     def _gc_run_only(self):
         name = self.gc_name.text().strip()
@@ -399,12 +589,45 @@ class GCTab(QWidget):
             _emit("SATG_GC_RUN " + name)
 
     def _gc_create_and_run(self):
-        self._gc_create()
-        self._gc_run_only()
+        with _batch_emit():
+            self._gc_create()
+            self._gc_run_only()
 
 
 # --- RC tab (Random Conflicts) ---------------------------------------------
 
+@dataclass(frozen=True, slots=True)
+class RCParams:
+    """RC tab inputs, read once from the widgets."""
+    name: str
+    n: int
+    types: str
+    center_lat: str
+    center_lon: str
+    radius_nm: float
+    altmode: str
+    tcpa: str
+    fl: str
+    cas: str
+    actypes: str
+    overwrite: int
+    angle: Optional[str]   # None unless 'cross' is selected
+    seed: int              # 0 = none
+    hsep: float
+    vsep: int
+
+def _build_rc_cmd(p: RCParams) -> str:
+    """SATG_RC_CIRCLE command for a parameter snapshot; blank free-text fields are left out."""
+    cmd = (f"SATG_RC_CIRCLE{_opt_kv('name', p.name)} n={p.n} types={p.types}"
+           f"{_opt_kv('center_lat', p.center_lat)}{_opt_kv('center_lon', p.center_lon)}"
+           f" radius_nm={p.radius_nm} altmode={p.altmode} tcpa={p.tcpa} fl={p.fl} cas={p.cas}"
+           f"{_opt_kv('actypes', p.actypes)} overwrite={p.overwrite}")
+    if p.angle is not None:
+        cmd += f" angle={p.angle}"
+    if p.seed != 0:
+        cmd += f" seed={p.seed}"
+    return cmd
+
 class RCTab(QWidget):
     """Random Conflicts (RC) — Circle-only region, types via checkboxes, run buttons."""
     def __init__(self, parent=None):
@@ -419,7 +642,7 @@ class RCTab(QWidget):
         f1 = QFormLayout(gb1)
 
         self.scn = QLineEdit("rc_circle")
-        self.n = QSpinBox(); self.n.setRange(1, 100000); self.n.setValue(20)
+        self.n = _spin(1, 100000, 20)
 
         # Types as checkboxes
         types_box = QWidget(); hb = QHBoxLayout(types_box); hb.setContentsMargins(0,0,0,0)
@@ -432,9 +655,8 @@ class RCTab(QWidget):
         self.alt_level   = QCheckBox("Level");    self.alt_level.setChecked(True)
         self.alt_altcross= QCheckBox("Alt-cross"); # unchecked default
         alt_hb.addWidget(self.alt_level); alt_hb.addWidget(self.alt_altcross); alt_hb.addStretch(1)
-        self.seed = QSpinBox(); self.seed.setRange(0, 2**31-1); self.seed.setValue(0)
-        self.hsep = QDoubleSpinBox(); self.hsep.setRange(0.1, 50.0); self.hsep.setDecimals(2); self.hsep.setValue(5.0)
-        self.vsep = QSpinBox();       self.vsep.setRange(100, 5000);  self.vsep.setValue(1000)
+        self.seed = _spin(0, 2**31-1, 0)
+        self.sep = SepMinimaBox()
 
         self.actypes = QLineEdit("A320,B738,A350,B78X")
         # Overwrite toggle (checkbox -> 0/1 when emitting)
@@ -442,84 +664,91 @@ class RCTab(QWidget):
         self.gc_overwrite_cb.setChecked(False)
 
         # TCPA lo/hi (seconds)
-        self.tcpa_lo = QDoubleSpinBox(); self.tcpa_lo.setDecimals(0); self.tcpa_lo.setRange(0, 3600); self.tcpa_lo.setValue(60)
-        self.tcpa_hi = QDoubleSpinBox(); self.tcpa_hi.setDecimals(0); self.tcpa_hi.setRange(0, 3600); self.tcpa_hi.setValue(240)
+        self.tcpa_lo = _spin(0, 3600, 60)
+        self.tcpa_hi = _spin(0, 3600, 240)
         # keep lo <= hi
-        self.tcpa_lo.valueChanged.connect(lambda v: self.tcpa_hi.setMinimum(v))
-        self.tcpa_hi.valueChanged.connect(lambda v: self.tcpa_lo.setMaximum(v))
+        _link_range(self.tcpa_lo, self.tcpa_hi)
         row_tcpa = QWidget(); hb_tcpa = QHBoxLayout(row_tcpa); hb_tcpa.setContentsMargins(0,0,0,0)
         hb_tcpa.addWidget(self.tcpa_lo); hb_tcpa.addWidget(QLabel(" to ")); hb_tcpa.addWidget(self.tcpa_hi)
 
         # Cross angle lo/hi (deg)
-        self.ang_lo = QDoubleSpinBox(); self.ang_lo.setDecimals(0); self.ang_lo.setRange(0, 180); self.ang_lo.setValue(60)
-        self.ang_hi = QDoubleSpinBox(); self.ang_hi.setDecimals(0); self.ang_hi.setRange(0, 180); self.ang_hi.setValue(120)
-        self.ang_lo.valueChanged.connect(lambda v: self.ang_hi.setMinimum(v))
-        self.ang_hi.valueChanged.connect(lambda v: self.ang_lo.setMaximum(v))
+        self.ang_lo = _spin(0, 180, 60)
+        self.ang_hi = _spin(0, 180, 120)
+        _link_range(self.ang_lo, self.ang_hi)
         row_ang = QWidget(); hb_ang = QHBoxLayout(row_ang); hb_ang.setContentsMargins(0,0,0,0)
         hb_ang.addWidget(self.ang_lo); hb_ang.addWidget(QLabel(" to ")); hb_ang.addWidget(self.ang_hi)
         
-        f1.addRow("Scenario name:", self.scn)
-        f1.addRow("Number of conflicts (n):", self.n)
-        f1.addRow("Types:", types_box)
-        f1.addRow("Alt mode:", alt_row)
-        f1.addRow("TCPA [s] (lo:hi):", row_tcpa)
-        f1.addRow("Cross angle [deg] (lo:hi):", row_ang)
-        f1.addRow("Seed (0=none):", self.seed)
-        f1.addRow("HSEP [NM]:", self.hsep)
-        f1.addRow("VSEP [ft]:", self.vsep)
-        f1.addRow("AC types:", self.actypes)
+        for label, w in (
+            ("Scenario name:", self.scn),
+            ("Number of conflicts (n):", self.n),
+            ("Types:", types_box),
+            ("Alt mode:", alt_row),
+            ("TCPA [s] (lo:hi):", row_tcpa),
+            ("Cross angle [deg] (lo:hi):", row_ang),
+            ("Seed (0=none):", self.seed),
+            ("AC types:", self.actypes),
+        ):
+            f1.addRow(label, w)
+        f1.addRow(self.sep)
         f1.addRow(self.gc_overwrite_cb)
 
-        def _upd_angle_enabled():
-            self.ang_lo.setEnabled(self.cb_cross.isChecked())
-            self.ang_hi.setEnabled(self.cb_cross.isChecked())
+        # enable angle range only when Crossing is selected
+        cross = self.cb_cross.isChecked()
+        for w in (self.ang_lo, self.ang_hi):
+            self.cb_cross.toggled.connect(w.setEnabled)
+            w.setEnabled(cross)
 
-        self.cb_cross.toggled.connect(lambda _: _upd_angle_enabled())
-        _upd_angle_enabled()
+        # types CSV is rebuilt only when a type checkbox changes
+        self._types_csv_cache = ""
+        for cb in (self.cb_headon, self.cb_cross, self.cb_overtake):
+            cb.toggled.connect(self._recompute_types_csv)
+        self._recompute_types_csv()
 
         # 2) Circle region
         gb2 = QGroupBox("2) Circle region")
         f2 = QFormLayout(gb2)
 
-        # Make the note a widget, style the widget (not the layout), then add it
-        desc = QLabel("CPA uniformly sampled in a circle. All aircraft spawn at t=0; CPA time equals TCPA.")
-        desc.setStyleSheet("color: #666; font-style: italic;")
+        # Note as a hint label (styled by the window stylesheet)
+        desc = _hint_label("CPA uniformly sampled in a circle. All aircraft spawn at t=0; CPA time equals TCPA.")
         # Add as a full-width row in the form
         f2.addRow(desc)
 
 
         self.c_lat = QLineEdit("52.10")
         self.c_lon = QLineEdit("4.50")
-        self.c_rad = QDoubleSpinBox(); self.c_rad.setRange(0.1, 1000.0); self.c_rad.setDecimals(2); self.c_rad.setValue(25.0)
+        self.c_lat.setValidator(_coord_validator_shared())
+        self.c_lon.setValidator(_coord_validator_shared())
+        self.c_rad = _spin(0.1, 1000.0, 25.0, decimals=2)
 
         # FL lo/hi (flight levels)
-        self.fl_lo = QDoubleSpinBox(); self.fl_lo.setDecimals(0); self.fl_lo.setRange(0, 500); self.fl_lo.setValue(290)
-        self.fl_hi = QDoubleSpinBox(); self.fl_hi.setDecimals(0); self.fl_hi.setRange(0, 500); self.fl_hi.setValue(370)
-        self.fl_lo.valueChanged.connect(lambda v: self.fl_hi.setMinimum(v))
-        self.fl_hi.valueChanged.connect(lambda v: self.fl_lo.setMaximum(v))
+        self.fl_lo = _spin(0, 500, 290)
+        self.fl_hi = _spin(0, 500, 370)
+        _link_range(self.fl_lo, self.fl_hi)
         row_fl = QWidget(); hb_fl = QHBoxLayout(row_fl); hb_fl.setContentsMargins(0,0,0,0)
         hb_fl.addWidget(self.fl_lo); hb_fl.addWidget(QLabel(" to ")); hb_fl.addWidget(self.fl_hi)
 
         # CAS lo/hi (kt)
-        self.cas_lo = QDoubleSpinBox(); self.cas_lo.setDecimals(0); self.cas_lo.setRange(100, 600); self.cas_lo.setValue(220)
-        self.cas_hi = QDoubleSpinBox(); self.cas_hi.setDecimals(0); self.cas_hi.setRange(100, 600); self.cas_hi.setValue(280)
-        self.cas_lo.valueChanged.connect(lambda v: self.cas_hi.setMinimum(v))
-        self.cas_hi.valueChanged.connect(lambda v: self.cas_lo.setMaximum(v))
+        self.cas_lo = _spin(100, 600, 220)
+        self.cas_hi = _spin(100, 600, 280)
+        _link_range(self.cas_lo, self.cas_hi)
         row_cas = QWidget(); hb_cas = QHBoxLayout(row_cas); hb_cas.setContentsMargins(0,0,0,0)
         hb_cas.addWidget(self.cas_lo); hb_cas.addWidget(QLabel(" to ")); hb_cas.addWidget(self.cas_hi)
         
-        f2.addRow("Center lat [deg]:", self.c_lat)
-        f2.addRow("Center lon [deg]:", self.c_lon)
-        f2.addRow("Radius [NM]:", self.c_rad)
-        f2.addRow("FL range (lo:hi):", row_fl)
-        f2.addRow("CAS range [kt] (lo:hi):", row_cas)
+        for label, w in (
+            ("Center lat [deg]:", self.c_lat),
+            ("Center lon [deg]:", self.c_lon),
+            ("Radius [NM]:", self.c_rad),
+            ("FL range (lo:hi):", row_fl),
+            ("CAS range [kt] (lo:hi):", row_cas),
+        ):
+            f2.addRow(label, w)
 
         # 3) Actions
         gb3 = QGroupBox("3) Actions")
         row = QWidget(); h = QHBoxLayout(row); h.setContentsMargins(0,0,0,0); h.setSpacing(8)
-        self.btn_cre = QPushButton("CREATE SCENARIO")
-        self.btn_run = QPushButton("RUN SCENARIO")
-        self.btn_both= QPushButton("CREATE & RUN SCENARIO")
+        self.btn_cre = QPushButton(_BTN_CREATE)
+        self.btn_run = QPushButton(_BTN_RUN)
+        self.btn_both= QPushButton(_BTN_CREATE_RUN)
         self.btn_cre.clicked.connect(self._create)
         self.btn_run.clicked.connect(self._run)
         self.btn_both.clicked.connect(self._create_and_run)
@@ -528,113 +757,130 @@ class RCTab(QWidget):
 
         main.addWidget(gb1); main.addWidget(gb2); main.addWidget(gb3); main.addStretch(1)
 
-    def _types_csv(self) -> str:
+    def _recompute_types_csv(self, *_):
         t = []
         if self.cb_headon.isChecked():   t.append("headon")
         if self.cb_cross.isChecked():    t.append("cross")
         if self.cb_overtake.isChecked(): t.append("overtake")
-        return ",".join(t)
+        self._types_csv_cache = ",".join(t)
+
+    def _types_csv(self) -> str:
+        return self._types_csv_cache
 
     def _ensure_types(self) -> bool:
         if self._types_csv(): return True
         _emit("ECHO SATGGUI: Select at least one type.")
         return False
 
-    def _create(self):
-        # 0) Must have at least one conflict type selected
-        if not self._ensure_types():
+    def _read_params(self) -> RCParams:
+        """Snapshot every RC input in one pass over the widgets."""
+        level, altcross = self.alt_level.isChecked(), self.alt_altcross.isChecked()
+        if level and altcross:
+            altmode = "mix"
+        elif altcross:
+            altmode = "altcross"
+        else:
+            altmode = "level"  # level, or fallback
+        hsep, vsep = self.sep.values()
+
+        return RCParams(
+            name=self.scn.text().strip(),
+            n=self.n.value(),
+            types=self._types_csv(),
+            center_lat=self.c_lat.text().strip(),
+            center_lon=self.c_lon.text().strip(),
+            radius_nm=float(self.c_rad.value()),
+            altmode=altmode,
+            # Ranges from spin boxes -> "lo:hi"
+            tcpa=_range_val(self.tcpa_lo, self.tcpa_hi, "TCPA"),   # seconds
+            fl=_range_val(self.fl_lo, self.fl_hi, "FL"),           # flight levels
+            cas=_range_val(self.cas_lo, self.cas_hi, "CAS"),       # knots
+            actypes=self.actypes.text().strip(),
+            overwrite=1 if self.gc_overwrite_cb.isChecked() else 0,
+            # Angle only matters if 'cross' is selected
+            angle=_range_val(self.ang_lo, self.ang_hi, "Cross angle") if self.cb_cross.isChecked() else None,
+            seed=self.seed.value(),
+            hsep=hsep,
+            vsep=vsep,
+        )
+
+    def _create(self, run: bool = False):
+        # Must have at least one conflict type selected
+        if not self._types_csv():
+            _emit("ECHO SATGGUI: Select at least one type.")
             return
 
-        # 1) Alt mode from checkboxes
-        if self.alt_level.isChecked() and self.alt_altcross.isChecked():
-            altmode_val = "mix"
-        elif self.alt_level.isChecked():
-            altmode_val = "level"
-        elif self.alt_altcross.isChecked():
-            altmode_val = "altcross"
-        else:
-            altmode_val = "level"  # fallback
-
-        # 2) Push HSEP/VSEP first so backend minima are in sync
-        _emit(f"SATG_GC_CONF {self.hsep.value()} {self.vsep.value()}")
-
-        # 3) Gather inputs
-        name_val   = self.scn.text().strip()
-        types_csv  = self._types_csv()  # from head-on / crossing / overtake checkboxes
-        center_lat = self.c_lat.text().strip()
-        center_lon = self.c_lon.text().strip()
-        radius_nm  = float(self.c_rad.value())
-        seed_val   = int(self.seed.value())
-        actypes_val = self.actypes.text().strip()
-        overwrite_val = 1 if self.overwrite.isChecked() else 0
-
-        # Ranges from spin boxes -> "lo:hi"
-        tcpa_lo, tcpa_hi = int(self.tcpa_lo.value()), int(self.tcpa_hi.value())   # seconds
-        fl_lo,   fl_hi   = int(self.fl_lo.value()),   int(self.fl_hi.value())     # flight levels
-        cas_lo,  cas_hi  = int(self.cas_lo.value()),  int(self.cas_hi.value())    # knots
-
-        # 4) Build command tokens
-        toks = [
-            "SATG_RC_CIRCLE",
-            _kv("name", name_val),
-            _kv("n", self.n.value()),
-            _kv("types", types_csv),
-            _kv("center_lat", center_lat),
-            _kv("center_lon", center_lon),
-            _kv("radius_nm", radius_nm),
-            _kv("altmode", altmode_val),
-            _kv("tcpa", f"{tcpa_lo}:{tcpa_hi}"),
-            _kv("fl",   f"{fl_lo}:{fl_hi}"),
-            _kv("cas",  f"{cas_lo}:{cas_hi}"),
-            _kv("actypes", actypes_val),
-            _kv("overwrite", overwrite_val),
-        ]
-
-        # Angle only matters if 'cross' is selected
-        type_set = {t.strip() for t in types_csv.split(",") if t.strip()}
-        if "cross" in type_set:
-            ang_lo, ang_hi = int(self.ang_lo.value()), int(self.ang_hi.value())
-            toks.append(_kv("angle", f"{ang_lo}:{ang_hi}"))
-
-        # Seed is optional; omit if 0
-        if seed_val != 0:
-            toks.append(_kv("seed", seed_val))
-
-        # 5) Emit
-        _emit(_join_tokens(*toks))
+        p = self._read_params()
+        # Push HSEP/VSEP first so backend minima are in sync
+        _emit_batch(
+            f"SATG_GC_CONF {p.hsep} {p.vsep}",
+            _build_rc_cmd(p),
+            self._run_cmd(p.name) if run else None,
+        )
+
+    @staticmethod
+    def _run_cmd(nm: str) -> str:
+        if nm: return _join_tokens("SATG_GC_RUN", _kv_str("name", nm))
+        return "ECHO SATGGUI: Set a scenario name before running."
 
     def _run(self):
-        nm = self.scn.text().strip()
-        if nm: _emit(_join_tokens("SATG_GC_RUN", _kv("name", nm)))
-        else:  _emit("ECHO SATGGUI: Set a scenario name before running.")
+        _emit(self._run_cmd(self.scn.text().strip()))
 
     def _create_and_run(self):
-        self._create()
-        self._run()
+        # one widget pass: create emits the run with the name it already read
+        self._create(run=True)
 
 # --- main window ------------------------------------------------------------
 
 class SATGWindow(QWidget):
+    _TABS = (
+        (RLTab, "Realistic Replay"),
+        (GCTab, "Geometric Conflicts"),
+        (RCTab, "Random Conflicts"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("SATG GUI")
         self.resize(980, 720)
+        self.setStyleSheet(_HINT_STYLE)
         layout = QVBoxLayout(self)
 
-        tabs = QTabWidget(self)
-        tabs.addTab(RLTab(self), "Realistic Replay")
-        tabs.addTab(GCTab(self), "Geometric Conflicts")
-        tabs.addTab(RCTab(self), "Random Conflicts")
+        # Tabs are built on first selection; placeholders stand in until then.
+        self.tabs = tabs = QTabWidget(self)
+        self._tab_factories = {}
+        for idx, (factory, label) in enumerate(self._TABS):
+            tabs.addTab(QWidget(), label)
+            self._tab_factories[idx] = factory
+        tabs.currentChanged.connect(self._build_tab)
+        self._build_tab(tabs.currentIndex())
 
         self.top = TopStrip(self)
 
         layout.addWidget(self.top)
         layout.addWidget(tabs, 1)
 
+    def _build_tab(self, idx: int):
+        factory = self._tab_factories.pop(idx, None)
+        if factory is None:
+            return
+        tabs = self.tabs
+        label = tabs.tabText(idx)
+        placeholder = tabs.widget(idx)
+        # build and swap with painting suspended: one layout/paint pass at the end
+        tabs.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(tabs):
+                tabs.removeTab(idx)
+                tabs.insertTab(idx, factory(self), label)
+                tabs.setCurrentIndex(idx)
+        finally:
+            tabs.setUpdatesEnabled(True)
+        placeholder.deleteLater()
+
 # single instance + lazy creation
 _window = None
 def _get_window():
-    from PyQt6.QtWidgets import QApplication
     global _window
     if QApplication.instance() is None:
         raise RuntimeError("SATGGUI: GUI not ready; run BlueSky with GUI and call SATGGUI after startup.")
@@ -0,0 +1,48 @@
+"""
+Tests the SATG RL loader: unrelated or unreadable CSVs next to the data
+files are skipped, a malformed flights/points file fails the load.
+"""
+from bluesky.plugins import SATG
+
+
+FLIGHTS = "ECTRL ID,ADEP,ADES,AC Type\n1,EHAM,EGLL,A320\n"
+POINTS = ("ECTRL ID,Sequence Number,Time Over,Flight Level,Latitude,Longitude,"
+          "Delay Time Over,Dev Latitude,Dev Longitude,Dev Flight Level,"
+          "ground_speed,vertical_speed,heading,pitch\n"
+          "1,1,00:10:00,100,52.3,4.7,0,0,0,0,250,0,270,0\n"
+          "1,2,00:12:00,120,52.3,4.2,0,0,0,0,260,0,270,0\n")
+
+
+def write_csvs(tmp_path, **files):
+    """ Write name=content pairs as CSV files and return their paths. """
+    paths = []
+    for name, content in files.items():
+        path = tmp_path / f"{name}.csv"
+        path.write_bytes(content if isinstance(content, bytes) else content.encode())
+        paths.append(str(path))
+    return paths
+
+
+def test_load_skips_unrelated_csvs(tmp_path):
+    """
+    Test that ragged, unterminated and undecodable non-data CSVs are skipped.
+    """
+    paths = write_csvs(tmp_path, flights=FLIGHTS, points=POINTS,
+                       ragged="a,b\n1,2\n3,4,5\n",
+                       quote='a,b\n"x,6\n',
+                       binary=b"\xff\xfe\x00bad")
+    ok, msg = SATG._load_paths(paths)
+    assert ok, msg
+    assert list(SATG.STATE.flights) == ["1"]
+    assert len(SATG.STATE.base_points["1"]["t"]) == 2
+
+
+def test_load_fails_on_malformed_points(tmp_path):
+    """
+    Test that a file classified as flights_points but not parseable fails the load.
+    """
+    paths = write_csvs(tmp_path, flights=FLIGHTS,
+                       points=POINTS + '1,"3,00:14:00\n')
+    ok, msg = SATG._load_paths(paths)
+    assert not ok
+    assert "points.csv" in msg
@@ -0,0 +1,65 @@
+"""
+Tests the SATG .scn sorting: merging an appended tail into an already-sorted
+file must give the same result as sorting the whole file.
+"""
+import pytest
+
+from bluesky.plugins import SATG
+
+
+HEADER = ["0:00:00.00>HOLD\n", "0:00:00.00>ASAS ON\n"]
+
+
+def full_sort(tmp_path, lines):
+    """ Sort the whole file (no tail offset) and return its lines. """
+    path = tmp_path / "full.scn"
+    path.write_text("".join(lines), encoding="utf-8")
+    SATG._sort_scn_file(str(path))
+    return path.read_text(encoding="utf-8").splitlines(True)
+
+
+def tail_sort(tmp_path, old, new):
+    """ Append new to old, sort with the tail offset and return the lines. """
+    path = tmp_path / "tail.scn"
+    path.write_text("".join(old), encoding="utf-8")
+    tail_from = path.stat().st_size
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(new))
+    SATG._sort_scn_file(str(path), tail_from)
+    return path.read_text(encoding="utf-8").splitlines(True)
+
+
+@pytest.mark.parametrize("old, new", [
+    # Appended tail with timestamps equal to the old body: old lines go first
+    (HEADER + ["0:00:10.00>CRE A1\n", "0:00:20.00>CRE A2\n"],
+     ["0:00:20.00>CRE B2\n", "0:00:10.00>CRE B1\n", "0:00:10.00>CRE B0\n"]),
+    # Stray non-timestamped lines in both the sorted prefix and the tail
+    (HEADER + ["0:00:05.00>CRE A1\n", "0:01:00.00>CRE A2\n", "# old note\n"],
+     ["# new note\n", "0:00:30.00>CRE B1\n", "\n", "0:00:01.50>CRE B2\n"]),
+    # Unsorted prefix: the merge is skipped and the full sort is used
+    (HEADER + ["0:00:30.00>CRE A2\n", "0:00:10.00>CRE A1\n"],
+     ["0:00:20.00>CRE B1\n"]),
+    # Stray line ahead of stamped lines in the prefix: also not in sorted layout
+    (HEADER + ["# note\n", "0:00:10.00>CRE A1\n"],
+     ["0:00:05.00>CRE B1\n"]),
+])
+def test_merge_tail_matches_full_sort(tmp_path, old, new):
+    """
+    Test _sort_scn_file with tail_from against sorting the whole file.
+    """
+    assert tail_sort(tmp_path, old, new) == full_sort(tmp_path, old + new)
+
+
+def test_merge_sorted_tail_fallback():
+    """
+    Test that _merge_sorted_tail only merges into a prefix in sorted layout.
+    """
+    unsorted = HEADER + ["0:00:30.00>CRE A2\n", "0:00:10.00>CRE A1\n"]
+    assert SATG._merge_sorted_tail(unsorted + ["0:00:20.00>CRE B1\n"],
+                                   len(unsorted)) is None
+
+    ordered = HEADER + ["0:00:10.00>CRE A1\n", "0:00:30.00>CRE A2\n"]
+    merged = SATG._merge_sorted_tail(ordered + ["0:00:20.00>CRE B1\n"],
+                                     len(ordered))
+    assert merged == HEADER + ["0:00:10.00>CRE A1\n", "0:00:20.00>CRE B1\n",
+                               "0:00:30.00>CRE A2\n"]